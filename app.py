@@ -1,4 +1,4 @@
-from flask import Flask, redirect, url_for, render_template, request, jsonify, send_file
+from flask import Flask, redirect, url_for, render_template, request, jsonify, send_file, Response, stream_with_context
 from flask_admin import Admin, BaseView, expose
 from flask_admin.contrib.sqla import ModelView
 from models import db, Connection, Mapping, MappingColumn, Template, GeneratedDAG, MetaDB, CustomOperator
@@ -7,6 +7,15 @@ import subprocess
 import tempfile
 from datetime import datetime
 from jupyter_manager import get_kernel_manager
+from job_manager import get_job_manager, current_job_id, report_progress
+from oracle_pool import configure_pools, acquire_connection, evict_pool
+import catalog_cache
+from type_mapping import convert_type, convert_types
+from dag_publisher import DagPublisher
+from dag_store import content_digest, points_to_blob
+from shared_extraction import group_by_extraction, targets_of
+from dag_renderer import get_compiled_template, iter_render_parallel, dag_fingerprint
+from dag_naming import DagNameFormatter, get_naming_formatter, invalidate_naming_formatter, find_duplicate_names
 
 app = Flask(__name__)
 
@@ -15,9 +24,52 @@ app.config['SECRET_KEY'] = 'dev-key-123'
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///toy_airflow.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+# Mapping 생성 시 소스 메타데이터 병렬 조회 설정
+app.config['INTROSPECTION_MAX_WORKERS'] = 8
+app.config['INTROSPECTION_PER_CONN_LIMIT'] = 4  # 소스 Connection 당 동시 조회 수
+
+# Background job worker 수 (장시간 작업: 매핑/DAG 생성, Excel/ZIP 다운로드)
+app.config['JOB_MAX_WORKERS'] = 2
+
+# Oracle Session Pool 설정 (Connection / MetaDB 별 공유 Pool)
+app.config['ORACLE_POOL_MIN'] = 1
+app.config['ORACLE_POOL_MAX'] = 4
+app.config['ORACLE_POOL_IDLE_TIMEOUT'] = 300  # 초
+configure_pools(
+    min=app.config['ORACLE_POOL_MIN'],
+    max=app.config['ORACLE_POOL_MAX'],
+    idle_timeout=app.config['ORACLE_POOL_IDLE_TIMEOUT'],
+)
+
+# Catalog(스키마/테이블/컬럼) 메타데이터 캐시 유효 시간 (초)
+app.config['CATALOG_CACHE_TTL'] = 3600
+
+# S3 CSV 스키마 추론: head/middle/tail 구간 샘플링 설정
+app.config['S3_CSV_SAMPLE_BYTES'] = 1024 * 1024  # 전체 byte budget
+app.config['S3_CSV_SAMPLE_RANGES'] = 3
+app.config['S3_CSV_SAMPLE_MAX_ROWS'] = 5000
+
+# generate_dags(parallel_render=true) 시 DAG 렌더링 process 수 (None = CPU core 수)
+app.config['DAG_RENDER_PROCESSES'] = None
+
+# 일괄 삭제 시 파일 삭제 thread 수
+app.config['FILE_REMOVE_WORKERS'] = 8
+
 # Initialize DB
 db.init_app(app)
 
+def enable_sqlite_foreign_keys(dbapi_conn, connection_record):
+    # SQLite는 connection마다 켜야 FK(ON DELETE CASCADE / SET NULL)가 동작
+    import sqlite3
+    if isinstance(dbapi_conn, sqlite3.Connection):
+        cursor = dbapi_conn.cursor()
+        cursor.execute('PRAGMA foreign_keys=ON')
+        cursor.close()
+
+with app.app_context():
+    from sqlalchemy import event
+    event.listen(db.engine, 'connect', enable_sqlite_foreign_keys)
+
 @app.errorhandler(404)
 def not_found_error(error):
     with open('dags_generation_debug.log', 'a') as log_file:
@@ -46,6 +98,16 @@ def method_not_allowed_error(error):
         return jsonify({'status': 'error', 'message': 'Method not allowed'}), 405
     return render_template('404.html'), 405
 
+def submit_background_job(job_type):
+    """Queue the current request as a background job and return a 202 response."""
+    payload = dict(request.json or {})
+    payload.pop('async', None)
+    job = get_job_manager(app).submit(job_type, request.path, payload)
+    return {'status': 'accepted', 'job_id': job.id, 'message': f'Job {job.id} queued'}, 202
+
+def wants_background_job(data):
+    return bool(data.get('async')) and current_job_id() is None
+
 class ConnectionView(ModelView):
     # Override the list view template
     list_template = 'connection_list.html'
@@ -159,7 +221,9 @@ class ConnectionView(ModelView):
             if request.form.get('password'): # Only update password if provided
                 conn.password = request.form.get('password')
             
+            catalog_cache.invalidate(conn.id)
             db.session.commit()
+            evict_pool('Connection', conn.id)
             return redirect(url_for('.index_view'))
         
         return self.render('add_connection.html', connection=conn)
@@ -167,14 +231,69 @@ class ConnectionView(ModelView):
     @expose('/delete/<int:id>', methods=['POST'])
     def delete_view(self, id):
         conn = Connection.query.get_or_404(id)
+        catalog_cache.invalidate(conn.id)
         db.session.delete(conn)
         db.session.commit()
+        evict_pool('Connection', id)
         return {'status': 'success', 'message': 'Connection deleted successfully'}, 200
 
 # Setup Admin
 admin = Admin(app, name='Toy Airflow', url='/admin')
 
-from models import db, Connection, Mapping, MappingColumn, Template, TemplateVariable, GeneratedDAG, MetaDB, DagNamingRule, CustomOperator
+from models import db, Connection, Mapping, MappingColumn, Template, TemplateVariable, GeneratedDAG, MetaDB, DagNamingRule, CustomOperator, BackgroundJob
+
+def mapping_column_row(**values):
+    """Plain MappingColumn row for bulk inserts (all rows share the same keys)."""
+    row = {
+        'mapping_id': None,
+        'source_column': None,
+        'source_type': None,
+        'is_pk': False,
+        'is_nullable': True,
+        'column_order': None,
+        'target_column': None,
+        'target_type': None,
+        'target_logical_name': None,
+        'source_column_desc': None,
+        'is_extraction_condition': False,
+        'is_partition': False,
+        'trans_rule': None,
+    }
+    row.update(values)
+    return row
+
+def bulk_insert_mappings(mapping_rows, column_rows_per_mapping, batch_size=1000):
+    """Insert mappings and their columns with executemany batches (no per-row ORM tracking).
+
+    column_rows_per_mapping[i] holds the column rows of mapping_rows[i]; their
+    mapping_id is filled in here. Returns the new mapping ids in input order.
+    The caller commits.
+    """
+    from sqlalchemy import insert
+    if not mapping_rows:
+        return []
+
+    dialect = db.session.get_bind().dialect
+    if getattr(dialect, 'insert_executemany_returning_sort_by_parameter_order', False):
+        mapping_ids = list(db.session.scalars(
+            insert(Mapping).returning(Mapping.id, sort_by_parameter_order=True),
+            mapping_rows
+        ))
+    else:
+        # RETURNING + executemany 미지원 DB: mapping만 한 건씩, 컬럼은 여전히 일괄 insert
+        mapping_ids = [db.session.execute(insert(Mapping).values(**row)).inserted_primary_key[0] for row in mapping_rows]
+
+    batch = []
+    for mapping_id, column_rows in zip(mapping_ids, column_rows_per_mapping):
+        for row in column_rows:
+            row['mapping_id'] = mapping_id
+            batch.append(row)
+            if len(batch) >= batch_size:
+                db.session.execute(insert(MappingColumn), batch)
+                batch = []
+    if batch:
+        db.session.execute(insert(MappingColumn), batch)
+    return mapping_ids
 
 class MappingView(BaseView):
     @expose('/')
@@ -201,6 +320,9 @@ class MappingView(BaseView):
         if not source_conn_id or not target_conn_id or not selected_tables:
             return {'status': 'error', 'message': 'Missing required fields'}, 400
 
+        if wants_background_job(data):
+            return submit_background_job('generate_mapping')
+
         # Get source connection for DB introspection
         source_conn = Connection.query.get(source_conn_id)
         if not source_conn:
@@ -213,106 +335,13 @@ class MappingView(BaseView):
 
         def get_oracle_columns(conn_obj, owner, table_name):
             """Fetch real column metadata from Oracle DB."""
-            import oracledb
-            dsn = f"{conn_obj.host}:{conn_obj.port}/{conn_obj.database}"
-            result = {
-                'table_comment': '',
-                'columns': [],  # list of dicts
-            }
-            
-            with oracledb.connect(user=conn_obj.username, password=conn_obj.password, dsn=dsn) as connection:
-                with connection.cursor() as cursor:
-                    # 1. Table COMMENTS
-                    cursor.execute("""
-                        SELECT comments FROM ALL_TAB_COMMENTS 
-                        WHERE owner = :owner AND table_name = :table_name AND table_type = 'TABLE'
-                    """, {'owner': owner, 'table_name': table_name})
-                    row = cursor.fetchone()
-                    result['table_comment'] = row[0] if row and row[0] else ''
-
-                    # 2. PK columns
-                    cursor.execute("""
-                        SELECT cols.column_name
-                        FROM ALL_CONSTRAINTS cons
-                        JOIN ALL_CONS_COLUMNS cols 
-                          ON cons.constraint_name = cols.constraint_name AND cons.owner = cols.owner
-                        WHERE cons.constraint_type = 'P'
-                          AND cons.owner = :owner AND cons.table_name = :table_name
-                    """, {'owner': owner, 'table_name': table_name})
-                    pk_columns = set(row[0] for row in cursor.fetchall())
-
-                    # 3. Partition key columns
-                    cursor.execute("""
-                        SELECT column_name
-                        FROM ALL_PART_KEY_COLUMNS
-                        WHERE owner = :owner AND name = :table_name AND object_type = 'TABLE'
-                    """, {'owner': owner, 'table_name': table_name})
-                    partition_columns = set(row[0] for row in cursor.fetchall())
-
-                    # 4. Column COMMENTS
-                    cursor.execute("""
-                        SELECT column_name, comments FROM ALL_COL_COMMENTS
-                        WHERE owner = :owner AND table_name = :table_name
-                    """, {'owner': owner, 'table_name': table_name})
-                    col_comments = {}
-                    for row in cursor.fetchall():
-                        col_comments[row[0]] = row[1] if row[1] else ''
-
-                    # 5. Column metadata
-                    cursor.execute("""
-                        SELECT column_name, data_type, data_length, data_precision, 
-                               data_scale, nullable
-                        FROM ALL_TAB_COLUMNS
-                        WHERE owner = :owner AND table_name = :table_name
-                        ORDER BY column_id
-                    """, {'owner': owner, 'table_name': table_name})
-                    
-                    for row in cursor.fetchall():
-                        col_name = row[0]
-                        data_type = row[1]
-                        data_length = row[2]
-                        data_precision = row[3]
-                        data_scale = row[4]
-                        nullable = row[5]  # 'Y' or 'N'
-                        
-                        # Format Oracle type to readable string
-                        if data_type in ('VARCHAR2', 'CHAR', 'NVARCHAR2', 'NCHAR'):
-                            type_str = f"{data_type}({data_length})"
-                        elif data_type == 'NUMBER':
-                            if data_precision and data_scale and data_scale > 0:
-                                type_str = f"DECIMAL({data_precision},{data_scale})"
-                            elif data_precision:
-                                type_str = f"NUMBER({data_precision})"
-                            else:
-                                type_str = "INTEGER"
-                        elif data_type in ('FLOAT', 'BINARY_FLOAT', 'BINARY_DOUBLE'):
-                            type_str = data_type
-                        elif data_type == 'DATE':
-                            type_str = 'DATE'
-                        elif 'TIMESTAMP' in data_type:
-                            type_str = 'TIMESTAMP'
-                        elif data_type in ('CLOB', 'NCLOB', 'LONG'):
-                            type_str = 'TEXT'
-                        elif data_type in ('BLOB', 'RAW', 'LONG RAW'):
-                            type_str = data_type
-                        else:
-                            type_str = data_type
-                        
-                        result['columns'].append({
-                            'name': col_name,
-                            'type': type_str,
-                            'is_pk': col_name in pk_columns,
-                            'is_nullable': nullable == 'Y',
-                            'is_partition': col_name in partition_columns,
-                            'comment': col_comments.get(col_name, ''),
-                        })
-            
-            return result
+            from oracle_catalog import fetch_table_metadata
+            with acquire_connection(conn_obj) as connection:
+                return fetch_table_metadata(connection, owner, table_name)
             
         def get_s3_columns(conn_obj, file_key):
             import boto3
-            import pandas as pd
-            import io
+            from s3_schema import infer_csv_columns, infer_parquet_columns
             
             endpoint_url = f"http://{conn_obj.host}:{conn_obj.port}" if conn_obj.host and conn_obj.port else None
             client = boto3.client(
@@ -329,113 +358,29 @@ class MappingView(BaseView):
             }
             
             try:
-                # Get small portion of file
                 if file_key.lower().endswith('.csv'):
-                    # For CSV, read just the first few bytes to get header + 1 row
-                    response = client.get_object(Bucket=conn_obj.database, Key=file_key, Range='bytes=0-10240')
-                    body = response['Body'].read()
-                    
-                    # Ensure we have at least a full line by ignoring the last partial line if needed
-                    # pandas handles this gracefully with error_bad_lines=False or simply reading 1 row
-                    df = pd.read_csv(io.BytesIO(body), nrows=1)
+                    # For CSV, sample head/middle/tail ranges within a fixed byte budget
+                    # and infer types over thousands of rows (delimiter/encoding sniffed)
+                    result['columns'] = infer_csv_columns(
+                        client, conn_obj.database, file_key,
+                        byte_budget=app.config.get('S3_CSV_SAMPLE_BYTES', 1024 * 1024),
+                        ranges=app.config.get('S3_CSV_SAMPLE_RANGES', 3),
+                        max_rows=app.config.get('S3_CSV_SAMPLE_MAX_ROWS', 5000),
+                    )
                 elif file_key.lower().endswith('.parquet'):
-                    # For Parquet, we need to read the whole file or at least the metadata
-                    # To keep it simple, we'll download the whole file in memory if it's small,
-                    # but since it's a toy, we'll try to get the object
-                    response = client.get_object(Bucket=conn_obj.database, Key=file_key)
-                    body = response['Body'].read()
-                    df = pd.read_parquet(io.BytesIO(body))
-                    # Just keep 1 row
-                    if len(df) > 0:
-                        df = df.head(1)
+                    # For Parquet, only the footer is fetched (ranged GETs) and the
+                    # logical types (decimal, timestamp unit, int width) are kept
+                    result['columns'] = infer_parquet_columns(client, conn_obj.database, file_key)
                 else:
                     raise ValueError("Unsupported file format")
-                    
-                for col_name, dtype in df.dtypes.items():
-                    # Map pandas dtypes to generic SQL types
-                    is_nullable = True
-                    type_str = 'VARCHAR(255)'
-                    
-                    if pd.api.types.is_numeric_dtype(dtype):
-                        if pd.api.types.is_float_dtype(dtype):
-                            type_str = 'FLOAT'
-                        else:
-                            type_str = 'INTEGER'
-                    elif pd.api.types.is_datetime64_any_dtype(dtype):
-                        type_str = 'TIMESTAMP'
-                    elif pd.api.types.is_bool_dtype(dtype):
-                        type_str = 'BOOLEAN'
-                    
-                    result['columns'].append({
-                        'name': str(col_name).strip(),
-                        'type': type_str,
-                        'is_pk': False,
-                        'is_nullable': is_nullable,
-                        'is_partition': False,
-                        'comment': '',
-                    })
             except Exception as e:
                 print(f"Error extracting schema from S3: {e}")
                 raise
                 
             return result
 
-        def format_target_type(oracle_type, target_db_type='postgres'):
-            """Convert Oracle type to target DB type based on target database."""
-            import re
-            t = oracle_type.upper().strip()
-            
-            if target_db_type == 'postgres':
-                # Oracle → PostgreSQL 타입 매핑
-                if 'NVARCHAR2' in t:
-                    # NVARCHAR2(n) → VARCHAR(n)
-                    m = re.search(r'\((\d+)\)', oracle_type)
-                    return f"VARCHAR({m.group(1)})" if m else 'VARCHAR(255)'
-                elif 'VARCHAR2' in t:
-                    # VARCHAR2(n) → VARCHAR(n)
-                    return oracle_type.upper().replace('VARCHAR2', 'VARCHAR')
-                elif t.startswith('NCHAR'):
-                    # NCHAR(n) → CHAR(n)
-                    return oracle_type.upper().replace('NCHAR', 'CHAR')
-                elif t.startswith('CHAR'):
-                    # CHAR(n) → 그대로
-                    return oracle_type.upper()
-                elif t.startswith('NUMBER'):
-                    # NUMBER(p,s) → NUMERIC(p,s), NUMBER → NUMERIC
-                    m = re.search(r'\((.+?)\)', oracle_type)
-                    return f"NUMERIC({m.group(1)})" if m else 'NUMERIC'
-                elif t == 'INTEGER':
-                    return 'INTEGER'
-                elif t.startswith('DECIMAL'):
-                    # DECIMAL(p,s) → NUMERIC(p,s)
-                    return oracle_type.upper().replace('DECIMAL', 'NUMERIC')
-                elif t in ('FLOAT', 'BINARY_FLOAT'):
-                    return 'REAL'
-                elif t == 'BINARY_DOUBLE':
-                    return 'DOUBLE PRECISION'
-                elif t == 'DATE':
-                    return 'TIMESTAMP'
-                elif t.startswith('TIMESTAMP'):
-                    return 'TIMESTAMP'
-                elif t in ('CLOB', 'NCLOB', 'LONG'):
-                    return 'TEXT'
-                elif t == 'BLOB':
-                    return 'BYTEA'
-                elif t.startswith('RAW') or t == 'LONG RAW':
-                    return 'BYTEA'
-                elif t == 'TEXT':
-                    return 'TEXT'
-                else:
-                    return oracle_type
-            else:
-                # Oracle → Oracle (그대로 유지)
-                if t.startswith('NCHAR'):
-                    return oracle_type.replace('NCHAR', 'CHAR')
-                return oracle_type
-
-        new_mappings = []
-        for table in selected_tables:
-            # Parse owner.table_name
+        def parse_table(table):
+            """Split a selected table into (owner, table_name, target_table_name)."""
             if source_conn.conn_type == 's3':
                 basename = table.split('/')[-1]
                 if '.' in basename:
@@ -444,60 +389,126 @@ class MappingView(BaseView):
                     target_table_name = basename.lower()
                 
                 # For S3, owner is unused, and table_name is just the full key
-                owner = ''
-                table_name = table.upper()
+                return '', table.upper(), target_table_name
+
+            parts = table.split('.')
+            if len(parts) == 2:
+                owner = parts[0].upper()
+                table_name = parts[1].upper()
             else:
-                parts = table.split('.')
-                if len(parts) == 2:
-                    owner = parts[0].upper()
-                    table_name = parts[1].upper()
+                owner = source_schema.upper() if source_schema else (source_conn.username.upper() if source_conn.username else '')
+                table_name = table.upper()
+            return owner, table_name, table.split('.')[-1].lower()
+
+        parsed_tables = [(table,) + parse_table(table) for table in selected_tables]
+
+        # ---------------------------------------------------------
+        # 1. INTROSPECTION PHASE: worker pool, connection별 동시 실행 수 제한
+        # ---------------------------------------------------------
+        from introspection import run_bounded
+        max_workers = app.config.get('INTROSPECTION_MAX_WORKERS', 8)
+        per_conn_limit = app.config.get('INTROSPECTION_PER_CONN_LIMIT', 4)
+        col_data_by_table = {}
+        fetch_errors = {}
+
+        # Catalog cache: TTL 이내에 조회된 컬럼 메타데이터는 재사용
+        cache_keys = {
+            table: (f"{owner}.{table_name}" if source_conn.conn_type == 'oracle' else table)
+            for table, owner, table_name, _ in parsed_tables
+        }
+        cache_hits = 0
+        if source_conn.conn_type in ('oracle', 's3') and not data.get('refresh_catalog', False):
+            cached = catalog_cache.get_cached_many(source_conn.id, 'columns', cache_keys.values(),
+                                                   app.config['CATALOG_CACHE_TTL'])
+            for table, key in cache_keys.items():
+                if key in cached:
+                    col_data_by_table[table] = cached[key]
+            cache_hits = len(col_data_by_table)
+        pending_tables = [pt for pt in parsed_tables if pt[0] not in col_data_by_table]
+
+        batch_harvest = data.get('batch_harvest', True)
+        if source_conn.conn_type == 'oracle' and batch_harvest:
+            # Batched harvest: owner별로 한 세션에서 카탈로그를 일괄 조회
+            from oracle_catalog import harvest_metadata
+            tables_by_owner = {}
+            for _, owner, table_name, _ in pending_tables:
+                tables_by_owner.setdefault(owner, []).append(table_name)
+
+            results = run_bounded(
+                lambda owner: harvest_metadata(source_conn, {owner: tables_by_owner[owner]}),
+                tables_by_owner.keys(), source_conn.id, max_workers, per_conn_limit
+            )
+            for table, owner, table_name, _ in pending_tables:
+                harvested, error = results[owner]
+                if error is not None:
+                    fetch_errors[table] = error
+                elif (owner, table_name) not in harvested:
+                    fetch_errors[table] = LookupError(f"No catalog metadata found for {owner}.{table_name}")
                 else:
-                    owner = source_schema.upper() if source_schema else (source_conn.username.upper() if source_conn.username else '')
-                    table_name = table.upper()
-                
-                target_table_name = table.split('.')[-1].lower()
-            
-            # Try to fetch real columns from DB or S3
-            col_data = None
-            table_comment = ''
-            try:
+                    col_data_by_table[table] = harvested[(owner, table_name)]
+        elif source_conn.conn_type in ('oracle', 's3'):
+            table_keys = {table: (owner, table_name) for table, owner, table_name, _ in pending_tables}
+
+            def introspect(table):
                 if source_conn.conn_type == 'oracle':
-                    col_data = get_oracle_columns(source_conn, owner, table_name)
-                    table_comment = col_data.get('table_comment', '')
-                    print(f"DEBUG: Fetched {len(col_data['columns'])} real columns for {table}")
-                elif source_conn.conn_type == 's3':
-                    col_data = get_s3_columns(source_conn, table)
-                    table_comment = col_data.get('table_comment', '')
-                    print(f"DEBUG: Fetched {len(col_data['columns'])} columns from S3 file {table}")
-            except Exception as e:
-                print(f"WARNING: Failed to fetch real columns for {table}: {e}")
-                import traceback
-                traceback.print_exc()
-                col_data = None
+                    owner, table_name = table_keys[table]
+                    return get_oracle_columns(source_conn, owner, table_name)
+                return get_s3_columns(source_conn, table)
+
+            results = run_bounded(introspect, table_keys.keys(), source_conn.id, max_workers, per_conn_limit)
+            for table, (col_data, error) in results.items():
+                if error is not None:
+                    fetch_errors[table] = error
+                else:
+                    col_data_by_table[table] = col_data
+
+        fresh_entries = {
+            cache_keys[table]: col_data_by_table[table]
+            for table, _, _, _ in pending_tables
+            if col_data_by_table.get(table) and col_data_by_table[table]['columns']
+        }
+        if fresh_entries:
+            catalog_cache.put_cached_many(source_conn.id, 'columns', fresh_entries)
+
+        # ---------------------------------------------------------
+        # 2. WRITE PHASE: 선택 순서대로 한 번에 Meta DB 반영
+        # ---------------------------------------------------------
+        mapping_rows = []
+        column_rows_per_mapping = []
+        fallback_tables = []
+        target_db_type = target_conn.conn_type.lower() if target_conn else 'postgres'
+        for idx, (table, owner, table_name, target_table_name) in enumerate(parsed_tables):
+            col_data = col_data_by_table.get(table)
+            table_comment = col_data.get('table_comment', '') if col_data else ''
+            if table in fetch_errors:
+                print(f"WARNING: Failed to fetch real columns for {table}: {fetch_errors[table]}")
+            elif col_data:
+                print(f"DEBUG: Fetched {len(col_data['columns'])} columns for {table}")
+            if not (col_data and col_data['columns']):
+                fallback_tables.append(table)
             
-            mapping = Mapping(
-                source_conn_id=source_conn_id,
-                target_conn_id=target_conn_id,
-                source_schema=source_schema,
-                target_schema=target_schema,
-                source_table=table,
-                target_table=target_table_name,
-                source_table_desc=table_comment,
-                status='Draft'
-            )
-            db.session.add(mapping)
-            db.session.flush()
+            mapping_rows.append({
+                'source_conn_id': source_conn_id,
+                'target_conn_id': target_conn_id,
+                'source_schema': source_schema,
+                'target_schema': target_schema,
+                'source_table': table,
+                'target_table': target_table_name,
+                'source_table_desc': table_comment,
+                'status': 'Draft',
+            })
 
+            column_rows = []
             if col_data and col_data['columns']:
                 # Use real DB columns
                 has_etl_col = False
+                target_types = convert_types([col['type'] for col in col_data['columns']], source_conn.conn_type, target_db_type)
                 for i, col in enumerate(col_data['columns']):
                     col_name = col['name']
                     if col_name.upper() in ('ETL_DTM', 'ETL_CRY_DTM'):
                         has_etl_col = True
                     
-                    mapping_col = MappingColumn(
-                        mapping_id=mapping.id,
+                    column_rows.append(mapping_column_row(
                         source_column=col_name.upper(),
                         source_type=col['type'],
                         is_pk=col['is_pk'],
@@ -505,16 +516,14 @@ class MappingView(BaseView):
                         is_partition=col['is_partition'],
                         column_order=i + 1,
                         target_column=col_name.lower(),
-                        target_type=format_target_type(col['type'], target_conn.conn_type.lower() if target_conn else 'postgres'),
+                        target_type=target_types[i],
                         target_logical_name=col['comment'] if col['comment'] else col_name.replace('_', ' ').capitalize(),
                         source_column_desc=col['comment'],
-                    )
-                    db.session.add(mapping_col)
+                    ))
                 
                 # Add ETL_CRY_DTM if not present
                 if not has_etl_col:
-                    etl_col = MappingColumn(
-                        mapping_id=mapping.id,
+                    column_rows.append(mapping_column_row(
                         source_column='SYSDATE',
                         source_type='SYSTEM',
                         is_pk=False,
@@ -525,12 +534,10 @@ class MappingView(BaseView):
                         target_type='TIMESTAMP',
                         target_logical_name='ETL Creation Time',
                         source_column_desc='ETL 생성 시간',
-                    )
-                    db.session.add(etl_col)
+                    ))
             else:
                 # Fallback: minimal columns if DB fetch failed
-                fallback_col = MappingColumn(
-                    mapping_id=mapping.id,
+                column_rows.append(mapping_column_row(
                     source_column='*',
                     source_type='UNKNOWN',
                     is_pk=False,
@@ -540,13 +547,24 @@ class MappingView(BaseView):
                     target_type='UNKNOWN',
                     target_logical_name='All Columns (DB fetch failed)',
                     source_column_desc='DB 연결 실패로 컬럼 정보를 가져올 수 없습니다.',
-                )
-                db.session.add(fallback_col)
+                ))
 
-            new_mappings.append(mapping)
+            column_rows_per_mapping.append(column_rows)
+            mapping_rows[-1]['source_sql'] = format_source_sql(table, [row['source_column'] for row in column_rows])
+            mapping_rows[-1]['source_sql_version'] = 1
+            report_progress(idx + 1, len(parsed_tables), {'table': table, 'fallback': table in fallback_tables})
+
+        # Bulk insert: ORM 객체 / 매핑별 flush 없이 executemany 방식으로 일괄 저장
+        new_mappings = bulk_insert_mappings(mapping_rows, column_rows_per_mapping)
         
         db.session.commit()
-        return {'status': 'success', 'message': f'{len(new_mappings)} mappings generated'}, 200
+        return {
+            'status': 'success',
+            'message': f'{len(new_mappings)} mappings generated',
+            'fallback_tables': fallback_tables,
+            'errors': {table: str(e) for table, e in fetch_errors.items()},
+            'cache': {'hit': cache_hits, 'miss': len(pending_tables)},
+        }, 200
 
 
     @expose('/delete/<int:id>', methods=['POST'])
@@ -565,7 +583,9 @@ class MappingView(BaseView):
     @expose('/api/detail/<int:id>')
     def api_detail_view(self, id):
         # API to return JSON data for the modal
-        mapping = Mapping.query.get_or_404(id)
+        Mapping.query.get_or_404(id)
+        # 저장된 SQL이 현재 컬럼과 다르면 다시 만들어 저장
+        mapping, source_sql = load_mappings_with_sql([id])[0]
         columns = []
         for col in mapping.columns:
             columns.append({
@@ -593,6 +613,8 @@ class MappingView(BaseView):
             'source_conn': f"{mapping.source_conn.name} ({mapping.source_conn.conn_type})",
             'target_conn': f"{mapping.target_conn.name} ({mapping.target_conn.conn_type})",
             'source_table_desc': mapping.source_table_desc or '',
+            'source_sql': source_sql,
+            'source_sql_version': mapping.source_sql_version or 0,
             'columns': columns
         }, 200
 
@@ -609,10 +631,13 @@ class MappingView(BaseView):
         if not mapping_ids:
             return {'status': 'error', 'message': 'No mappings selected'}, 400
 
+        if wants_background_job(data):
+            return submit_background_job('download_excel')
+
         mappings = Mapping.query.filter(Mapping.id.in_(mapping_ids)).all()
         
         all_data = []
-        for mapping in mappings:
+        for idx, mapping in enumerate(mappings):
             for col in mapping.columns:
                 all_data.append({
                     'Mapping Name': mapping.source_table,
@@ -629,6 +654,7 @@ class MappingView(BaseView):
                     'Is Nullable': 'Y' if col.is_nullable else 'N',
                     'Order': col.column_order
                 })
+            report_progress(idx + 1, len(mappings))
         
         if not all_data:
              return {'status': 'error', 'message': 'No data found for selected mappings'}, 404
@@ -674,44 +700,8 @@ class MappingView(BaseView):
             pks = []
             
             for col in sorted(mapping.columns, key=lambda x: x.column_order):
-                # Oracle → PostgreSQL 타입 매핑
-                data_type = col.target_type.strip() if col.target_type else 'TEXT'
-                dt_upper = data_type.upper()
-
-                if 'NVARCHAR2' in dt_upper or 'NVARCHAR' in dt_upper:
-                    # NVARCHAR2(n) / NVARCHAR(n) → VARCHAR(n)
-                    import re
-                    m = re.search(r'\((\d+)\)', data_type)
-                    data_type = f"VARCHAR({m.group(1)})" if m else 'VARCHAR(255)'
-                elif 'VARCHAR2' in dt_upper or 'VARCHAR' in dt_upper:
-                    # VARCHAR2(n) → VARCHAR(n)  (이미 VARCHAR(n)이면 그대로)
-                    data_type = data_type.upper().replace('VARCHAR2', 'VARCHAR')
-                elif dt_upper.startswith('NCHAR'):
-                    # NCHAR(n) → CHAR(n)
-                    data_type = data_type.upper().replace('NCHAR', 'CHAR')
-                elif dt_upper.startswith('CHAR'):
-                    # CHAR(n) → CHAR(n)  (PostgreSQL 지원)
-                    pass
-                elif dt_upper.startswith('NUMBER') or dt_upper == 'INTEGER':
-                    data_type = 'NUMERIC'
-                elif dt_upper.startswith('DECIMAL'):
-                    # DECIMAL(p,s) → NUMERIC(p,s)
-                    data_type = data_type.upper().replace('DECIMAL', 'NUMERIC')
-                elif dt_upper in ('FLOAT', 'BINARY_FLOAT'):
-                    data_type = 'REAL'
-                elif dt_upper == 'BINARY_DOUBLE':
-                    data_type = 'DOUBLE PRECISION'
-                elif dt_upper == 'DATE' or dt_upper.startswith('TIMESTAMP'):
-                    data_type = 'TIMESTAMP'
-                elif dt_upper in ('CLOB', 'NCLOB', 'LONG'):
-                    data_type = 'TEXT'
-                elif dt_upper == 'BLOB':
-                    data_type = 'BYTEA'
-                elif dt_upper.startswith('RAW') or dt_upper == 'LONG RAW':
-                    data_type = 'BYTEA'
-                elif dt_upper == 'SYSTEM':
-                    # ETL_CRY_DTM 등 시스템 생성 컬럼
-                    data_type = 'TIMESTAMP'
+                # Oracle 스타일로 남아있는 타입도 PostgreSQL 타입으로 정리
+                data_type = convert_type(col.target_type.strip() if col.target_type else 'TEXT', 'oracle', 'postgres')
                 
                 line = f"    {col.target_column} {data_type}"
                 
@@ -803,6 +793,7 @@ class MetaDBView(BaseView):
             if request.form.get('password'):
                 meta.password = request.form.get('password') if db_type != 'sqlite' else None
             db.session.commit()
+            evict_pool('MetaDB', meta.id)
             return redirect(url_for('.index_view'))
         return self.render('add_meta_db.html', meta_db=meta)
 
@@ -813,6 +804,7 @@ class MetaDBView(BaseView):
             return {'status': 'error', 'message': '활성 상태인 Meta DB는 삭제할 수 없습니다.'}, 400
         db.session.delete(meta)
         db.session.commit()
+        evict_pool('MetaDB', id)
         return {'status': 'success', 'message': 'Meta DB가 삭제되었습니다.'}, 200
 
     @expose('/test/<int:id>', methods=['POST'])
@@ -829,11 +821,8 @@ class MetaDBView(BaseView):
                 conn.close()
                 return {'status': 'success', 'message': f'SQLite 연결 성공: {meta.database}'}, 200
             elif meta.db_type == 'oracle':
-                import oracledb
-                dsn = f"{meta.host}:{meta.port}/{meta.database}"
-                conn = oracledb.connect(user=meta.username, password=meta.password, dsn=dsn)
-                conn.ping()
-                conn.close()
+                with acquire_connection(meta) as conn:
+                    conn.ping()
                 return {'status': 'success', 'message': f'Oracle 연결 성공: {meta.host}:{meta.port}'}, 200
             elif meta.db_type == 'postgres':
                 import psycopg2
@@ -904,31 +893,47 @@ admin.add_view(OperatorPlaygroundView(name='Operator Playground', endpoint='oper
 
 @app.route('/api/mappings/bulk_delete', methods=['POST'])
 def bulk_delete_mappings():
+    """Delete mappings with set-based statements.
+
+    MappingColumn rows are deleted with them; generated DAG records are kept
+    and unlinked (mapping_id = NULL) as before.
+    """
+    from sqlalchemy import delete, update
     data = request.json
     mapping_ids = data.get('mapping_ids', [])
 
     if not mapping_ids:
         return jsonify({'status': 'error', 'message': 'No mappings selected'}), 400
 
-    success_count = 0
-    errors = []
-    for mid in mapping_ids:
-        try:
-            mapping = Mapping.query.get(mid)
-            if mapping:
-                db.session.delete(mapping)
-                success_count += 1
-            else:
-                errors.append(f'Mapping ID {mid} not found')
-        except Exception as e:
-            errors.append(f'Mapping ID {mid}: {str(e)}')
+    try:
+        ids = list(dict.fromkeys(int(mid) for mid in mapping_ids))
+    except (TypeError, ValueError):
+        return jsonify({'status': 'error', 'message': 'Mapping IDs must be integers'}), 400
 
+    errors = []
     try:
+        found = set()
+        for chunk in id_chunks(ids):
+            found.update(row.id for row in db.session.query(Mapping.id).filter(Mapping.id.in_(chunk)))
+        errors = [f'Mapping ID {mid} not found' for mid in ids if mid not in found]
+
+        found_ids = [mid for mid in ids if mid in found]
+        for chunk in id_chunks(found_ids):
+            # 기존 DB(update_db_v10 이전, FK에 CASCADE/SET NULL이 없는 스키마)에서도 동작하도록
+            # 컬럼 삭제와 DAG 연결 해제는 직접 수행
+            db.session.execute(delete(MappingColumn).where(MappingColumn.mapping_id.in_(chunk)),
+                               execution_options={'synchronize_session': False})
+            db.session.execute(update(GeneratedDAG).where(GeneratedDAG.mapping_id.in_(chunk)).values(mapping_id=None),
+                               execution_options={'synchronize_session': False})
+            db.session.execute(delete(Mapping).where(Mapping.id.in_(chunk)),
+                               execution_options={'synchronize_session': False})
         db.session.commit()
+        db.session.expire_all()
     except Exception as e:
         db.session.rollback()
         return jsonify({'status': 'error', 'message': f'Database error: {str(e)}'}), 500
 
+    success_count = len(found_ids)
     if errors:
         return jsonify({'status': 'partial_success', 'message': f'Deleted {success_count} mappings. Errors: {"; ".join(errors)}'}), 207
     return jsonify({'status': 'success', 'message': f'Successfully deleted {success_count} mappings'}), 200
@@ -1004,10 +1009,13 @@ def api_update_mapping(id):
                 trans_rule=col_data.get('trans_rule')
             )
             db.session.add(new_col)
-            
+
     try:
+        # 저장된 source SQL을 새 컬럼 구성으로 다시 만들고 version 증가
+        db.session.flush()
+        refresh_source_sql(mapping)
         db.session.commit()
-        return jsonify({'status': 'success', 'message': 'Mapping updated successfully'}), 200
+        return jsonify({'status': 'success', 'message': 'Mapping updated successfully', 'source_sql_version': mapping.source_sql_version}), 200
     except Exception as e:
         db.session.rollback()
         return jsonify({'status': 'error', 'message': str(e)}), 500
@@ -1255,17 +1263,69 @@ def save_dag_naming_rule():
             )
             db.session.add(rule)
         db.session.commit()
+        invalidate_naming_formatter()
         return jsonify({'status': 'success', 'message': 'DAG 명명 규칙이 저장되었습니다.'}), 200
     except Exception as e:
         db.session.rollback()
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
-def generate_formatted_sql(mapping):
-    """Generates a formatted SQL query for a given mapping."""
-    columns = MappingColumn.query.filter_by(mapping_id=mapping.id).order_by(MappingColumn.column_order).all()
-    
-    if not columns:
-        return f"SELECT *\n  FROM {mapping.source_table}"
+@app.route('/api/dag-naming-rule/preview', methods=['POST'])
+def preview_dag_naming_rule():
+    """Apply the naming rule (saved one, or rule_tokens/separator from the body) to many mappings."""
+    from sqlalchemy.orm import joinedload
+    data = request.json or {}
+    mapping_ids = data.get('mapping_ids', [])
+    dag_id_prefix = (data.get('dag_id_prefix') or '').strip()
+
+    if not mapping_ids:
+        return jsonify({'status': 'error', 'message': 'Mapping IDs are required'}), 400
+
+    if data.get('rule_tokens'):
+        formatter = DagNameFormatter(data['rule_tokens'], data.get('separator', '_'))
+    else:
+        formatter = get_naming_formatter()
+
+    mappings = Mapping.query.options(
+        joinedload(Mapping.source_conn), joinedload(Mapping.target_conn)
+    ).filter(Mapping.id.in_(mapping_ids)).all()
+    mappings_by_id = {m.id: m for m in mappings}
+
+    timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+    names = []
+    for map_id in dict.fromkeys(mapping_ids):
+        mapping = mappings_by_id.get(map_id)
+        if not mapping:
+            continue
+        dag_name = formatter.format({
+            'source_table': mapping.source_table,
+            'target_table': mapping.target_table,
+            'source_conn_name': mapping.source_conn.name if mapping.source_conn else 'Unknown',
+            'target_conn_name': mapping.target_conn.name if mapping.target_conn else 'Unknown',
+        }, timestamp_str, dag_id_prefix)
+        names.append({'mapping_id': mapping.id, 'dag_name': dag_name, 'filename': f"{dag_name}.py"})
+
+    duplicates = find_duplicate_names((n['mapping_id'], n['dag_name']) for n in names)
+    # 이미 생성된 DAG 파일명과의 충돌도 한 번의 조회로 확인
+    filenames = [n['filename'] for n in names]
+    existing = set()
+    for i in range(0, len(filenames), 500):
+        existing.update(row[0] for row in db.session.query(GeneratedDAG.filename).filter(
+            GeneratedDAG.filename.in_(filenames[i:i + 500])).all())
+    for n in names:
+        n['duplicate'] = n['dag_name'] in duplicates
+        n['exists'] = n['filename'] in existing
+
+    return jsonify({
+        'status': 'success',
+        'names': names,
+        'duplicates': duplicates,
+        'existing': sorted(existing),
+    }), 200
+
+def format_source_sql(source_table, source_columns):
+    """Format the extraction SELECT for a table and its ordered source columns."""
+    if not source_columns:
+        return f"SELECT *\n  FROM {source_table}"
     
     # Format:
     # SELECT COL1
@@ -1274,52 +1334,251 @@ def generate_formatted_sql(mapping):
     #   FROM TABLE
     
     formatted_cols = []
-    # First column
-    first_col_source = columns[0].source_column
-    if first_col_source == 'SYSDATE':
-        first_col_source = 'SYSDATE AS ETL_CRY_DTM'
-    formatted_cols.append(f"SELECT {first_col_source}")
-    
-    # Subsequent columns
-    for col in columns[1:]:
-        source_col = col.source_column
+    for i, source_col in enumerate(source_columns):
         if source_col == 'SYSDATE':
             source_col = 'SYSDATE AS ETL_CRY_DTM'
-        formatted_cols.append(f"     , {source_col}")
+        formatted_cols.append(f"SELECT {source_col}" if i == 0 else f"     , {source_col}")
         
     query = "\n".join(formatted_cols)
-    query += f"\n  FROM {mapping.source_table}"
+    query += f"\n  FROM {source_table}"
     
     return query
 
+def generate_formatted_sql(mapping, columns=None):
+    """Generates a formatted SQL query for a given mapping (columns: pre-loaded, ordered)."""
+    if columns is None:
+        columns = MappingColumn.query.filter_by(mapping_id=mapping.id).order_by(
+            MappingColumn.column_order, MappingColumn.id).all()
+    return format_source_sql(mapping.source_table, [col.source_column for col in columns])
+
+def refresh_source_sql(mapping, columns=None):
+    """Re-render the stored source SQL of a mapping and bump its version; the caller commits."""
+    mapping.source_sql = generate_formatted_sql(mapping, columns)
+    mapping.source_sql_version = (mapping.source_sql_version or 0) + 1
+    return mapping.source_sql
+
+def load_mappings_with_sql(mapping_ids, chunk_size=500):
+    """Load mappings with both connections and their stored source SQL in a fixed number of queries.
+
+    Returns [(mapping, source_sql)] in the order of mapping_ids; unknown ids are
+    skipped. The stored SQL is checked against the live MappingColumn rows (one
+    source_column query per chunk), so columns changed outside
+    api_update_mapping (scripts, direct SQL) are picked up: stale or missing
+    SQL is re-rendered, its version bumped and saved once.
+    """
+    from sqlalchemy.orm import joinedload
+    ids = [int(i) for i in mapping_ids]
+    unique_ids = list(dict.fromkeys(ids))
+
+    def _load():
+        loaded = {}
+        for i in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[i:i + chunk_size]
+            for mapping in Mapping.query.options(
+                joinedload(Mapping.source_conn),
+                joinedload(Mapping.target_conn),
+            ).filter(Mapping.id.in_(chunk)).all():
+                loaded[mapping.id] = mapping
+        return loaded
+
+    by_id = _load()
+
+    columns_by_mapping = {}
+    found = list(by_id)
+    for i in range(0, len(found), chunk_size):
+        for row in db.session.query(MappingColumn.mapping_id, MappingColumn.source_column).filter(
+                MappingColumn.mapping_id.in_(found[i:i + chunk_size])).order_by(
+                MappingColumn.mapping_id, MappingColumn.column_order, MappingColumn.id).all():
+            columns_by_mapping.setdefault(row.mapping_id, []).append(row.source_column)
+
+    sqls = {}
+    stale = []
+    for map_id, mapping in by_id.items():
+        sqls[map_id] = format_source_sql(mapping.source_table, columns_by_mapping.get(map_id, []))
+        if sqls[map_id] != mapping.source_sql:
+            stale.append({'id': map_id, 'source_sql': sqls[map_id],
+                          'source_sql_version': (mapping.source_sql_version or 0) + 1})
+    if stale:
+        from sqlalchemy import update
+        db.session.execute(update(Mapping), stale)
+        db.session.commit()
+        by_id = _load()  # commit으로 만료된 객체를 건별 조회 대신 한 번에 다시 읽음
+
+    return [(by_id[map_id], sqls[map_id]) for map_id in ids if map_id in by_id]
+
+PREVIEW_PAGE_SIZE = 200
+PREVIEW_MAX_PAGE_SIZE = 1000
+PREVIEW_STREAM_CHUNK = 100  # 스트리밍 시 한 번에 읽는 mapping 수
+
+
+def preview_item(index, mapping, source_sql):
+    return {
+        'index': index,
+        'mapping_id': mapping.id,
+        'mapping_name': f"{mapping.source_table} -> {mapping.target_table}",
+        'source_sql': source_sql
+    }
+
+
+def iter_previews(mapping_ids, start=0, chunk_size=PREVIEW_STREAM_CHUNK):
+    """Yield preview dicts for mapping_ids[start:], loading one chunk at a time.
+
+    Each chunk is dropped from the session before the next one is loaded, so
+    memory stays bounded by chunk_size regardless of how many ids are selected.
+    """
+    for offset in range(start, len(mapping_ids), chunk_size):
+        chunk = mapping_ids[offset:offset + chunk_size]
+        # load_mappings_with_sql는 없는 id를 건너뛰므로 index는 요청 순서 기준으로 다시 맞춤
+        loaded = {mapping.id: (mapping, source_sql) for mapping, source_sql in load_mappings_with_sql(chunk)}
+        for i, map_id in enumerate(chunk):
+            if map_id in loaded:
+                yield preview_item(offset + i, *loaded[map_id])
+        db.session.expunge_all()
+
+
+def ndjson_previews(mapping_ids, start=0):
+    """NDJSON lines for the streaming preview (one mapping per line, then an end line)."""
+    import json
+    count = 0
+    try:
+        for item in iter_previews(mapping_ids, start):
+            yield json.dumps(dict(item, type='preview'), ensure_ascii=False) + '\n'
+            count += 1
+        yield json.dumps({'type': 'end', 'count': count}) + '\n'
+    except Exception as e:
+        db.session.rollback()
+        yield json.dumps({'type': 'error', 'message': str(e)}, ensure_ascii=False) + '\n'
+
+
 @app.route('/api/dags/preview', methods=['POST'])
 def preview_dags():
-    data = request.json
+    """SQL preview for the selected mappings.
+
+    Without `cursor` and `page_size` every preview is returned, as before.
+    Paginated when either is given: `cursor` is the position in mapping_ids to
+    continue from and `page_size` the number of mappings per page; the response
+    carries next_cursor (null on the last page). With `stream` set the whole
+    selection is sent as NDJSON, one mapping per line as soon as its SQL is ready.
+    """
+    data = request.json or {}
     mapping_ids = data.get('mapping_ids', [])
 
     if not mapping_ids:
         return {'status': 'error', 'message': 'Mapping IDs are required'}, 400
 
-    previews = []
     try:
-        for map_id in mapping_ids:
-            mapping = Mapping.query.get(map_id)
-            if not mapping:
-                continue
-
-            source_sql = generate_formatted_sql(mapping)
-            previews.append({
-                'mapping_name': f"{mapping.source_table} -> {mapping.target_table}",
-                'source_sql': source_sql
-            })
-            
-        return {'status': 'success', 'previews': previews}, 200
+        mapping_ids = [int(i) for i in mapping_ids]
+        cursor = int(data.get('cursor') or 0)
+        page_size = int(data.get('page_size') or PREVIEW_PAGE_SIZE)
+    except (TypeError, ValueError):
+        return {'status': 'error', 'message': 'mapping_ids, cursor and page_size must be integers'}, 400
+    cursor = max(cursor, 0)
+    page_size = min(max(page_size, 1), PREVIEW_MAX_PAGE_SIZE)
+
+    stream = data.get('stream', request.args.get('stream', ''))
+    if str(stream).lower() in ('1', 'true', 'yes'):
+        return Response(
+            stream_with_context(ndjson_previews(mapping_ids, cursor)),
+            mimetype='application/x-ndjson'
+        )
 
+    try:
+        if data.get('cursor') is None and data.get('page_size') is None:
+            return {'status': 'success', 'previews': list(iter_previews(mapping_ids))}, 200
+
+        page_ids = mapping_ids[cursor:cursor + page_size]
+        previews = list(iter_previews(page_ids))
+        for item in previews:
+            item['index'] += cursor
+        next_cursor = cursor + page_size if cursor + page_size < len(mapping_ids) else None
+
+        return {
+            'status': 'success',
+            'previews': previews,
+            'next_cursor': next_cursor,
+            'total': len(mapping_ids),
+        }, 200
+
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return {'status': 'error', 'message': str(e)}, 500
+
+@app.route('/api/dags/extraction_groups', methods=['POST'])
+def analyze_extraction_groups():
+    """Group mappings that read the same source with the same SQL (fan-out candidates)."""
+    data = request.json or {}
+    mapping_ids = data.get('mapping_ids', [])
+
+    if not mapping_ids:
+        return {'status': 'error', 'message': 'Mapping IDs are required'}, 400
+
+    try:
+        mapping_ids = [int(i) for i in mapping_ids]
+    except (TypeError, ValueError):
+        return {'status': 'error', 'message': 'Mapping IDs must be integers'}, 400
+
+    try:
+        mappings_data = [{
+            'id': mapping.id,
+            'source_conn_id': mapping.source_conn_id,
+            'source_conn_name': mapping.source_conn.name if mapping.source_conn else 'Unknown',
+            'source_table': mapping.source_table,
+            'target_table': mapping.target_table,
+            'target_conn_name': mapping.target_conn.name if mapping.target_conn else 'Unknown',
+            'source_sql': source_sql,
+        } for mapping, source_sql in load_mappings_with_sql(mapping_ids)]
+        groups = group_by_extraction(mappings_data)
+
+        return {
+            'status': 'success',
+            'mapping_count': len(mappings_data),
+            'extraction_count': len(groups),
+            'scans_saved': len(mappings_data) - len(groups),
+            'groups': [{
+                'source_conn_id': g[0]['source_conn_id'],
+                'source_conn': g[0]['source_conn_name'],
+                'source_table': g[0]['source_table'],
+                'source_sql': g[0]['source_sql'],
+                'mapping_ids': [m['id'] for m in g],
+                'targets': targets_of(g),
+            } for g in groups if len(g) > 1],
+        }, 200
     except Exception as e:
         import traceback
         traceback.print_exc()
         return {'status': 'error', 'message': str(e)}, 500
 
+def dag_file_shared(filepath, exclude_ids):
+    """True if a GeneratedDAG outside exclude_ids still uses filepath (fan-out DAGs share one file)."""
+    return db.session.query(GeneratedDAG.id).filter(
+        GeneratedDAG.filepath == filepath, ~GeneratedDAG.id.in_(list(exclude_ids))
+    ).first() is not None
+
+BULK_ID_CHUNK = 10000  # SQLite bind parameter 한도(32766) 이내
+
+def id_chunks(values, size=BULK_ID_CHUNK):
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+def remove_files(paths):
+    """Remove files on a thread pool; returns {path: error} for failures (missing files are not failures)."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            return str(e)
+        return None
+
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=app.config.get('FILE_REMOVE_WORKERS', 8), thread_name_prefix='file-remove') as executor:
+        return {path: error for path, error in zip(paths, executor.map(_remove, paths)) if error}
+
 @app.route('/api/dags/<int:id>', methods=['DELETE'])
 def delete_dag(id):
     with open('dags_generation_debug.log', 'a') as log_file:
@@ -1330,8 +1589,8 @@ def delete_dag(id):
         return {'status': 'error', 'message': 'DAG not found'}, 404
         
     try:
-        # Try to remove the file if it exists
-        if dag.filepath and os.path.exists(dag.filepath):
+        # Try to remove the file if it exists (and no other DAG record shares it)
+        if dag.filepath and os.path.exists(dag.filepath) and not dag_file_shared(dag.filepath, [dag.id]):
             try:
                 os.remove(dag.filepath)
             except Exception as e:
@@ -1343,74 +1602,166 @@ def delete_dag(id):
     except Exception as e:
         return {'status': 'error', 'message': str(e)}, 500
 
+def dag_download_query(data):
+    """Select (filename, filepath) for either explicit dag_ids or a filter.
+
+    filter keys (all optional): status, template_id, mapping_id, filename
+    (substring), created_from / created_to (ISO date or datetime).
+    """
+    query = db.session.query(GeneratedDAG.filename, GeneratedDAG.filepath)
+    dag_ids = data.get('dag_ids') or []
+    if dag_ids:
+        return query.filter(GeneratedDAG.id.in_([int(i) for i in dag_ids])).order_by(GeneratedDAG.id)
+
+    filters = data.get('filter') or {}
+    if filters.get('status'):
+        query = query.filter(GeneratedDAG.status == filters['status'])
+    if filters.get('template_id'):
+        query = query.filter(GeneratedDAG.template_id == int(filters['template_id']))
+    if filters.get('mapping_id'):
+        query = query.filter(GeneratedDAG.mapping_id == int(filters['mapping_id']))
+    if filters.get('filename'):
+        query = query.filter(GeneratedDAG.filename.contains(filters['filename'], autoescape=True))
+    if filters.get('created_from'):
+        query = query.filter(GeneratedDAG.created_at >= datetime.fromisoformat(filters['created_from']))
+    if filters.get('created_to'):
+        query = query.filter(GeneratedDAG.created_at <= datetime.fromisoformat(filters['created_to']))
+    return query.order_by(GeneratedDAG.id)
+
 @app.route('/api/dags/bulk_download', methods=['POST'])
 def bulk_download_dags():
-    import io
-    import zipfile
-    data = request.json
+    """Stream a ZIP of the selected DAG files.
+
+    Pass dag_ids, or filter (see dag_download_query) to download every DAG
+    matching it; {"filter": {}} downloads everything.
+    """
+    from zip_stream import iter_zip
+    data = request.json or {}
     dag_ids = data.get('dag_ids', [])
-    
-    if not dag_ids:
+
+    if not dag_ids and data.get('filter') is None:
         return {'status': 'error', 'message': 'No DAG IDs provided'}, 400
 
-    memory_file = io.BytesIO()
-    with zipfile.ZipFile(memory_file, 'w', zipfile.ZIP_DEFLATED) as zf:
-        for dag_id in dag_ids:
-            try:
-                dag = GeneratedDAG.query.get(dag_id)
-                if dag and dag.filepath and os.path.exists(dag.filepath):
-                    zf.write(dag.filepath, arcname=dag.filename)
-            except Exception as e:
-                print(f"Error zipping DAG {dag_id}: {str(e)}")
-    
-    memory_file.seek(0)
-    
+    try:
+        query = dag_download_query(data)
+    except (TypeError, ValueError) as e:
+        return {'status': 'error', 'message': f'Invalid filter: {e}'}, 400
+
+    if wants_background_job(data):
+        return submit_background_job('bulk_download_dags')
+
+    # 파일 경로만 한 번의 query로 미리 읽고 read transaction을 끝냄
+    # (stream 중에 cursor가 열려 있으면 SQLite SHARED lock 때문에 다른 쓰기가 실패)
+    try:
+        entries = [(row.filename, row.filepath) for row in query.all()]
+    finally:
+        db.session.rollback()
+    total = len(entries)
+
+    def generate():
+        yield from iter_zip(entries, on_entry=lambda count: report_progress(count, total))
+
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    return send_file(
-        memory_file,
+    return Response(
+        stream_with_context(generate()),
         mimetype='application/zip',
-        as_attachment=True,
-        download_name=f'generated_dags_{timestamp}.zip'
+        headers={'Content-Disposition': f'attachment; filename=generated_dags_{timestamp}.zip'}
     )
 
 @app.route('/api/dags/bulk_delete', methods=['POST'])
 def bulk_delete_dags():
+    """Delete DAG records in set-based statements, then remove their files concurrently.
+
+    Files still used by a DAG outside the selection (fan-out DAGs share one
+    file) are kept. The DB work is done before any file is touched so the
+    write lock is held only for the DELETE and commit.
+    """
+    from sqlalchemy import delete
     data = request.json
     dag_ids = data.get('dag_ids', [])
     
     if not dag_ids:
         return {'status': 'error', 'message': 'No DAG IDs provided'}, 400
 
-    success_count = 0
-    errors = []
+    try:
+        ids = list(dict.fromkeys(int(i) for i in dag_ids))
+    except (TypeError, ValueError):
+        return {'status': 'error', 'message': 'DAG IDs must be integers'}, 400
+    id_set = set(ids)
 
-    for dag_id in dag_ids:
-        try:
-            dag = GeneratedDAG.query.get(dag_id)
-            if not dag:
-                continue
-            
-            # Try to remove the file if it exists
-            if dag.filepath and os.path.exists(dag.filepath):
-                try:
-                    os.remove(dag.filepath)
-                except Exception as e:
-                    print(f"Warning: Could not delete file {dag.filepath}: {e}")
-            
-            db.session.delete(dag)
-            success_count += 1
-        except Exception as e:
-            errors.append(f"Error deleting DAG {dag_id}: {str(e)}")
-    
     try:
+        # 1. 읽기: 삭제 대상 파일과, 선택 밖의 DAG가 같이 쓰는 파일
+        paths = {}
+        for chunk in id_chunks(ids):
+            for row in db.session.query(GeneratedDAG.id, GeneratedDAG.filepath).filter(GeneratedDAG.id.in_(chunk)):
+                paths[row.id] = row.filepath
+        candidate_paths = list({p for p in paths.values() if p and p != 'Error'})
+        shared = set()
+        for chunk in id_chunks(candidate_paths):
+            for row in db.session.query(GeneratedDAG.id, GeneratedDAG.filepath).filter(GeneratedDAG.filepath.in_(chunk)):
+                if row.id not in id_set:
+                    shared.add(row.filepath)
+        db.session.rollback()
+
+        # 2. 쓰기: id 집합 단위 DELETE 후 바로 commit
+        found_ids = list(paths)
+        for chunk in id_chunks(found_ids):
+            db.session.execute(delete(GeneratedDAG).where(GeneratedDAG.id.in_(chunk)),
+                               execution_options={'synchronize_session': False})
         db.session.commit()
-        if errors:
-            return {'status': 'partial_success', 'message': f'Deleted {success_count} DAGs. Errors: {"; ".join(errors)}'}, 207
-        return {'status': 'success', 'message': f'Successfully deleted {success_count} DAGs'}, 200
+        db.session.expire_all()
     except Exception as e:
         db.session.rollback()
         return {'status': 'error', 'message': f'Database commit failed: {str(e)}'}, 500
 
+    # 3. 파일 삭제 (lock 밖에서 병렬로)
+    file_errors = remove_files([p for p in candidate_paths if p not in shared])
+    success_count = len(found_ids)
+    if file_errors:
+        return {
+            'status': 'partial_success',
+            'message': f'Deleted {success_count} DAGs. {len(file_errors)} file(s) could not be removed.',
+            'file_errors': file_errors,
+        }, 207
+    return {'status': 'success', 'message': f'Successfully deleted {success_count} DAGs'}, 200
+
+@app.route('/api/dags/reconcile', methods=['POST'])
+def reconcile_dags():
+    """Compare dags_output with the GeneratedDAG records.
+
+    Reports missing files, orphan files, files modified on disk and rows
+    without a content hash; `repair` takes any of missing / orphans /
+    modified / backfill (see dag_reconcile.repair). Lists are capped at
+    `limit` entries, the counts are always complete.
+    """
+    from dag_reconcile import reconcile, REPAIR_ACTIONS
+    data = request.json or {}
+    actions = data.get('repair') or []
+    unknown = [a for a in actions if a not in REPAIR_ACTIONS]
+    if unknown:
+        return {'status': 'error', 'message': f'Unknown repair action(s): {", ".join(unknown)}'}, 400
+
+    if wants_background_job(data):
+        return submit_background_job('reconcile_dags')
+
+    limit = int(data.get('limit') or 1000)
+    output_dir = os.path.abspath(os.path.join(app.root_path, '..', 'dags_output'))
+    os.makedirs(output_dir, exist_ok=True)
+    try:
+        report = reconcile(output_dir, actions, app.config.get('FILE_REMOVE_WORKERS', 8))
+    except Exception as e:
+        db.session.rollback()
+        return {'status': 'error', 'message': str(e)}, 500
+
+    kinds = ('missing', 'orphans', 'modified', 'unhashed')
+    return {
+        'status': 'success',
+        'counts': {k: len(report[k]) for k in kinds},
+        **{k: report[k][:limit] for k in kinds},
+        'scan': report['scan'],
+        'repaired': report['repaired'],
+    }, 200
+
 @app.before_request
 def log_request_info():
     if request.path.startswith('/api/'):
@@ -1425,40 +1776,121 @@ def get_dag_code_string(id_str):
         log_file.write(f"GET CODE request for STRING ID: {id_str}\n")
     return jsonify({'status': 'error', 'message': 'Invalid DAG ID format. ID must be an integer.'}), 400
 
+def dag_file_meta(id):
+    """(row, stat, etag, error) for a DAG's file without reading it; error is a response tuple or None.
+
+    The ETag is built from inode, size and mtime (prefixed with the stored
+    content hash when there is one), so any change on disk - including an
+    in-place edit - yields a new tag.
+    """
+    row = db.session.query(
+        GeneratedDAG.filename, GeneratedDAG.filepath, GeneratedDAG.content_hash
+    ).filter(GeneratedDAG.id == id).first()
+    if not row:
+        return None, None, None, ({'status': 'error', 'message': 'DAG not found'}, 404)
+    try:
+        st = os.stat(row.filepath) if row.filepath else None
+    except OSError:
+        st = None
+    if st is None:
+        return None, None, None, ({'status': 'error', 'message': 'DAG file not found on server'}, 404)
+
+    etag = f"{st.st_ino:x}-{st.st_size:x}-{st.st_mtime_ns:x}"
+    if row.content_hash:
+        etag = f"{row.content_hash}-{etag}"
+    return row, st, etag, None
+
 @app.route('/api/dags/<int:id>/code', methods=['GET'])
 def get_dag_code(id):
+    """DAG source as JSON ({filename, code}); ?raw=1 returns the file itself with Range support.
+
+    Both forms carry a strong ETag and answer If-None-Match with 304
+    without reading the file.
+    """
     with open('dags_generation_debug.log', 'a') as log_file:
         log_file.write(f"GET CODE request for DAG ID: {id}\n")
 
-    dag = GeneratedDAG.query.get(id)
-    if not dag:
-        return {'status': 'error', 'message': 'DAG not found'}, 404
-    
-    if not dag.filepath or not os.path.exists(dag.filepath):
-        return {'status': 'error', 'message': 'DAG file not found on server'}, 404
-        
-    try:
-        with open(dag.filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return {'filename': dag.filename, 'code': content}, 200
-    except Exception as e:
-        return {'status': 'error', 'message': f'Error reading file: {str(e)}'}, 500
+    row, st, etag, error = dag_file_meta(id)
+    if error:
+        return error
+
+    if request.args.get('raw', '').lower() in ('1', 'true', 'yes'):
+        response = send_file(row.filepath, mimetype='text/x-python', etag=etag, conditional=True)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+
+    # JSON 응답은 파일과 다른 표현이므로 filename까지 포함한 별도 ETag 사용
+    import hashlib
+    etag = f"{etag}-{hashlib.sha256(row.filename.encode('utf-8')).hexdigest()[:12]}"
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        try:
+            with open(row.filepath, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except Exception as e:
+            return {'status': 'error', 'message': f'Error reading file: {str(e)}'}, 500
+        response = jsonify({'filename': row.filename, 'code': content})
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'  # 매번 재검증 (변경 없으면 304)
+    return response
 
 @app.route('/api/dags/<int:id>/download', methods=['GET'])
 def download_dag(id):
-    dag = GeneratedDAG.query.get(id)
-    if not dag:
-        return {'status': 'error', 'message': 'DAG not found'}, 404
-    
-    if not dag.filepath or not os.path.exists(dag.filepath):
-            return {'status': 'error', 'message': 'DAG file not found on server'}, 404
-            
-    return send_file(
-        dag.filepath,
+    row, st, etag, error = dag_file_meta(id)
+    if error:
+        return error
+
+    # conditional=True: If-None-Match -> 304, Range / If-Range -> 206
+    response = send_file(
+        row.filepath,
         as_attachment=True,
-        download_name=dag.filename,
-        mimetype='application/x-python-code'
+        download_name=row.filename,
+        mimetype='application/x-python-code',
+        etag=etag,
+        conditional=True
     )
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def save_generated_dags(dag_rows):
+    """Persist GeneratedDAG rows with a single commit.
+
+    Rows with an 'id' update that existing record (incremental regeneration),
+    the others are inserted. Everything is written in one batch inside a
+    savepoint; if that fails, each row gets its own savepoint so one bad row
+    doesn't roll back the others. Returns [(row, error)] for the rows that
+    could not be saved.
+    """
+    from sqlalchemy import insert, update
+
+    def _write(rows):
+        inserts = [r for r in rows if 'id' not in r]
+        updates = [r for r in rows if 'id' in r]
+        if inserts:
+            db.session.execute(insert(GeneratedDAG), inserts)
+        if updates:
+            db.session.execute(update(GeneratedDAG), updates)
+
+    failed = []
+    if not dag_rows:
+        return failed
+    try:
+        with db.session.begin_nested():
+            _write(dag_rows)
+    except Exception:
+        for row in dag_rows:
+            try:
+                with db.session.begin_nested():
+                    _write([row])
+            except Exception as e:
+                failed.append((row, e))
+    try:
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        failed = [(row, e) for row in dag_rows]
+    return failed
 
 @app.route('/api/dags/generate', methods=['POST'])
 def generate_dags():
@@ -1473,10 +1905,22 @@ def generate_dags():
         dag_id_prefix = (data.get('dag_id_prefix') or '').strip()
         schedule_interval = data.get('schedule_interval')  # None / 'None' / '@once' / cron string
         catchup = data.get('catchup', False)  # bool
+        parallel_render = data.get('parallel_render', False)  # 대량 생성 시 process pool 렌더링
+        fan_out = data.get('fan_out', False)  # 같은 소스/SQL을 읽는 mapping은 DAG 하나로 묶음
+        publish_mode = data.get('publish_mode', 'batch')  # batch: 실행 끝에 일괄 게시, each: 파일마다 게시
+        incremental = data.get('incremental', False)  # 입력(fingerprint)이 바뀐 DAG만 다시 생성
 
         if not template_id or not mapping_ids:
             return {'status': 'error', 'message': 'Template ID and Mapping IDs are required'}, 400
 
+        try:
+            mapping_ids = [int(i) for i in mapping_ids]
+        except (TypeError, ValueError):
+            return {'status': 'error', 'message': 'Mapping IDs must be integers'}, 400
+
+        if wants_background_job(data):
+            return submit_background_job('generate_dags')
+
         # ---------------------------------------------------------
         # 1. READ PHASE: Fetch all necessary data into memory
         # ---------------------------------------------------------
@@ -1492,14 +1936,11 @@ def generate_dags():
         template_code = template.code
         template_name = template.name
         template_id_val = template.id
+        # 템플릿은 한 번만 토큰화 (id + 내용 hash로 캐시)
+        compiled_template = get_compiled_template(template_id_val, template_code)
 
         mappings_data = []
-        for map_id in mapping_ids:
-            mapping = Mapping.query.get(map_id)
-            if not mapping:
-                continue
-            
-            source_sql = generate_formatted_sql(mapping)
+        for mapping, source_sql in load_mappings_with_sql(mapping_ids):
 
             # S3 소스인 경우 source_table 경로에서 key_prefix와 file_extension 자동 추출
             src_conn_type = (mapping.source_conn.conn_type or '').lower() if mapping.source_conn else ''
@@ -1523,6 +1964,7 @@ def generate_dags():
 
             mapping_info = {
                 'id': mapping.id,
+                'source_conn_id': mapping.source_conn_id,
                 'source_table': mapping.source_table,
                 'target_table': mapping.target_table,
                 'source_conn_name': mapping.source_conn.name if mapping.source_conn else 'Unknown',
@@ -1536,9 +1978,64 @@ def generate_dags():
             }
             mappings_data.append(mapping_info)
         
+        # 생성 단위: 기본은 mapping 1개 = DAG 1개
+        # fan_out이면 (소스 Connection, 정규화된 SQL)이 같은 mapping을 DAG 하나로 묶고 첫 mapping 기준으로 이름/값 결정
+        groups = group_by_extraction(mappings_data) if fan_out else [[m_data] for m_data in mappings_data]
+        units = [dict(members[0], members=members) for members in groups]
+        if fan_out and any(len(u['members']) > 1 for u in units) and not (compiled_template.keys & {'targets', 'target_tables'}):
+            return {
+                'status': 'error',
+                'message': 'Fan-out needs a template that loads every target via {{ targets }} or {{ target_tables }}.',
+            }, 400
+
+        # DAG 이름은 쓰기 전에 한 번에 계산 (naming rule은 캐시된 formatter 사용)
+        naming_formatter = get_naming_formatter()
+        timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+        for m_data in units:
+            m_data['dag_name'] = naming_formatter.format(m_data, timestamp_str, dag_id_prefix)
+            # fingerprint용: timestamp 토큰을 고정값으로 둔 이름
+            m_data['name_key'] = naming_formatter.format(m_data, '{timestamp}', dag_id_prefix)
+
+        # incremental: 같은 템플릿으로 생성된 mapping별 최신 DAG
+        previous_dags = {}
+        if incremental:
+            ids = list(dict.fromkeys(m['id'] for m_data in units for m in m_data['members']))
+            for i in range(0, len(ids), 500):
+                for row in db.session.query(
+                    GeneratedDAG.id, GeneratedDAG.mapping_id, GeneratedDAG.filename,
+                    GeneratedDAG.filepath, GeneratedDAG.fingerprint
+                ).filter(
+                    GeneratedDAG.mapping_id.in_(ids[i:i + 500]),
+                    GeneratedDAG.template_id == template_id_val,
+                    GeneratedDAG.status == 'Generated',
+                ).order_by(GeneratedDAG.id).all():
+                    previous_dags[row.mapping_id] = row
+
+        # 이미 게시된 같은 DAG 파일 (content key -> 파일): 새 timestamp 파일 대신 재사용
+        # content key는 timestamp 토큰을 고정한 DAG 이름으로 만든 코드의 hash라 실행마다 바뀌지 않음
+        published_by_key = {}
+        ids = list(dict.fromkeys(m['id'] for m_data in units for m in m_data['members']))
+        for i in range(0, len(ids), 500):
+            for row in db.session.query(
+                GeneratedDAG.content_key, GeneratedDAG.content_hash, GeneratedDAG.filename, GeneratedDAG.filepath
+            ).filter(
+                GeneratedDAG.mapping_id.in_(ids[i:i + 500]),
+                GeneratedDAG.content_key.isnot(None),
+                GeneratedDAG.status == 'Generated',
+            ).all():
+                published_by_key[row.content_key] = (row.filename, row.filepath, row.content_hash)
+
         # Use rollback to release locks without destroying the session factory
         db.session.rollback()
 
+        duplicates = find_duplicate_names((m['id'], m['dag_name']) for m in units)
+        if duplicates and not data.get('allow_duplicate_names', False):
+            return {
+                'status': 'error',
+                'message': f'{len(duplicates)} DAG name(s) are shared by more than one mapping. Adjust the naming rule or prefix.',
+                'duplicates': duplicates,
+            }, 409
+
         with open('dags_generation_debug.log', 'a') as log_file:
             log_file.write(f"Data fetch complete. Found {len(mappings_data)} mappings. Locks released.\n")
 
@@ -1549,191 +2046,206 @@ def generate_dags():
         success_count = 0
         output_dir = os.path.abspath(os.path.join(app.root_path, '..', 'dags_output'))
         os.makedirs(output_dir, exist_ok=True)
+        publisher = DagPublisher(output_dir, batch=(publish_mode != 'each'))
         
         with open('dags_generation_debug.log', 'a') as log_file:
             log_file.write(f"Output dir validated. Starting loop.\n")
 
-        for m_data in mappings_data:
-            with open('dags_generation_debug.log', 'a') as log_file:
-                log_file.write(f"Generating code for mapping {m_data['id']}\n")
-                
-            try:
-                # Generate Code
-                dag_code = template_code
-                
-                # Filename & Dag Name Generation
-                import json as _json
-                timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-                naming_rule = DagNamingRule.query.first()
-
-                def _safe(s):
-                    return "".join([c if c.isalnum() or c in ('_', '-') else '_' for c in str(s or '')])
-
-                def _parse_schema_table(full_name):
-                    """OWNER.TABLE_NAME 형태면 분리, 아니면 schema='', table=full_name"""
-                    parts = str(full_name or '').split('.')
-                    if len(parts) >= 2:
-                        return parts[0], '.'.join(parts[1:])
-                    return '', full_name
-
-                src_schema, src_table_only = _parse_schema_table(m_data['source_table'])
-                tgt_schema, tgt_table_only = _parse_schema_table(m_data['target_table'])
-
-                if naming_rule and naming_rule.rule_tokens:
-                    try:
-                        tokens = _json.loads(naming_rule.rule_tokens)
-                        sep = naming_rule.separator or '_'
-                        parts = []
-                        for tok in tokens:
-                            t = tok.get('type')
-                            if t == 'src_schema':
-                                parts.append(_safe(src_schema or m_data['source_table'].split('.')[0]))
-                            elif t == 'src_table':
-                                parts.append(_safe(src_table_only or m_data['source_table']))
-                            elif t == 'tgt_schema':
-                                parts.append(_safe(tgt_schema or m_data['target_table'].split('.')[0]))
-                            elif t == 'tgt_table':
-                                parts.append(_safe(tgt_table_only or m_data['target_table']))
-                            elif t == 'src_db':
-                                parts.append(_safe(m_data['source_conn_name']))
-                            elif t == 'tgt_db':
-                                parts.append(_safe(m_data['target_conn_name']))
-                            elif t == 'timestamp':
-                                parts.append(timestamp_str)
-                            elif t == 'literal':
-                                parts.append(_safe(tok.get('value', '')))
-                        dag_name = sep.join(p for p in parts if p)
-                    except Exception:
-                        dag_name = f"dag_{_safe(m_data['source_conn_name'])}_{_safe(m_data['source_table'])}_{timestamp_str}"
-                else:
-                    dag_name = f"dag_{_safe(m_data['source_conn_name'])}_{_safe(m_data['source_table'])}_{timestamp_str}"
-
-                # dag_id_prefix 적용
-                if dag_id_prefix:
-                    dag_name = f"{dag_id_prefix}_{dag_name}"
-
-                filename = f"{dag_name}.py"
-                filepath = os.path.join(output_dir, filename)
-
-                # schedule_interval 값 결정
-                if schedule_interval is None:
-                    sched_val = 'None'
-                elif str(schedule_interval).strip() in ('None', ''):
-                    sched_val = 'None'
-                elif str(schedule_interval).strip() == '@once':
-                    sched_val = '@once'
-                else:
-                    sched_val = f"'{schedule_interval}'"
-
-                catchup_val = 'True' if catchup else 'False'
-
-                # S3 소스에서 자동 추출된 값 사용 (기본값 포함)
-                eff_key_prefix     = m_data.get('s3_key_prefix', '')
-                eff_file_ext       = m_data.get('s3_file_extension', 'csv')
-                eff_file_path      = m_data.get('s3_file_path', '')   # 전체 S3 파일 경로
-                eff_csv_delimiter  = ','
-                eff_csv_has_header = 'True'
-
-                replacements = {
-                    '{{ source_sql }}': m_data['source_sql'],
-                    '{{ Source_SQL }}': m_data['source_sql'],
-                    '{{Source_SQL}}': m_data['source_sql'],
-                    '{{ SOURCE_SQL }}': m_data['source_sql'],
-                    '{{SOURCE_SQL}}': m_data['source_sql'],
-                    '{{ source_table }}': m_data['source_table'],
-                    '{{ target_table }}': m_data['target_table'],
-                    '{{ TABLE_NAME }}': m_data['target_table'],
-                    '{{TABLE_NAME}}': m_data['target_table'],
-                    '{{ source_conn }}': m_data['source_conn_name'],
-                    '{{ target_conn }}': m_data['target_conn_name'],
-                    '{{ Dag_Name }}': dag_name,
-                    '{{Dag_Name}}': dag_name,
-                    '{{DAG_NAME}}': dag_name,
-                    '{{ dag_name }}': dag_name,
-                    '{{ schedule_interval }}': sched_val,
-                    '{{schedule_interval}}': sched_val,
-                    '{{ SCHEDULE_INTERVAL }}': sched_val,
-                    '{{ catchup }}': catchup_val,
-                    '{{catchup}}': catchup_val,
-                    '{{ CATCHUP }}': catchup_val,
-                    # S3 → Oracle DAG 파라미터 (소스에서 자동 추출)
-                    '{{key_prefix}}': eff_key_prefix,
-                    '{{ key_prefix }}': eff_key_prefix,
-                    '{{file_extension}}': eff_file_ext,
-                    '{{ file_extension }}': eff_file_ext,
-                    '{{csv_delimiter}}': eff_csv_delimiter,
-                    '{{ csv_delimiter }}': eff_csv_delimiter,
-                    '{{csv_has_header}}': eff_csv_has_header,
-                    '{{ csv_has_header }}': eff_csv_has_header,
-                    # S3 전체 파일 경로 (source_table 그대로)
-                    '{{s3_file_path}}': eff_file_path,
-                    '{{ s3_file_path }}': eff_file_path,
-                    '{{S3_FILE_PATH}}': eff_file_path,
-                    '{{ S3_FILE_PATH }}': eff_file_path,
-                }
-                
-                for key, value in replacements.items():
-                    dag_code = dag_code.replace(key, value)
-                
+        # ---------------------------------------------------------
+        # 3. DB UPDATE PHASE: 결과는 모아서 한 트랜잭션으로 저장
+        #    (batch 게시는 정상 종료 시에만 게시/저장, each 게시는 중단돼도 이미 쓴 파일의 결과는 저장)
+        # ---------------------------------------------------------
+        # schedule_interval 값 결정
+        if schedule_interval is None:
+            sched_val = 'None'
+        elif str(schedule_interval).strip() in ('None', ''):
+            sched_val = 'None'
+        elif str(schedule_interval).strip() == '@once':
+            sched_val = '@once'
+        else:
+            sched_val = f"'{schedule_interval}'"
+
+        catchup_val = 'True' if catchup else 'False'
+
+        render_values = [{
+            'source_sql': m_data['source_sql'],
+            'source_table': m_data['source_table'],
+            'target_table': m_data['target_table'],
+            'source_conn': m_data['source_conn_name'],
+            'target_conn': m_data['target_conn_name'],
+            'dag_name': m_data['dag_name'],
+            'schedule_interval': sched_val,
+            'catchup': catchup_val,
+            # S3 → Oracle DAG 파라미터 (소스에서 자동 추출, 기본값 포함)
+            'key_prefix': m_data.get('s3_key_prefix', ''),
+            'file_extension': m_data.get('s3_file_extension', 'csv'),
+            'csv_delimiter': ',',
+            'csv_has_header': 'True',
+            # S3 전체 파일 경로 (source_table 그대로)
+            's3_file_path': m_data.get('s3_file_path', ''),
+            # fan-out 대상 목록 (Python literal, 단일 mapping이면 1건)
+            'targets': repr(targets_of(m_data['members'])),
+            'target_tables': repr([m['target_table'] for m in m_data['members']]),
+        } for m_data in units]
+
+        fingerprints = [dag_fingerprint(template_id_val, compiled_template, values, m_data['name_key'])
+                        for values, m_data in zip(render_values, units)]
+
+        # incremental: 묶인 mapping 모두 fingerprint가 같고 파일이 남아있으면 건너뜀
+        unchanged = set()
+        if incremental:
+            for idx, m_data in enumerate(units):
+                prevs = [previous_dags.get(m['id']) for m in m_data['members']]
+                if all(prev and prev.fingerprint == fingerprints[idx] and prev.filepath and os.path.exists(prev.filepath)
+                       for prev in prevs):
+                    unchanged.add(idx)
+        skipped_files = []
+
+        # parallel_render: 렌더링만 process pool에서 수행, 파일 쓰기/DB 저장은 입력 순서대로 여기서
+        rendered = None
+        to_render = [values for idx, values in enumerate(render_values) if idx not in unchanged]
+        if parallel_render and to_render:
+            rendered = iter_render_parallel(template_id_val, template_code, to_render,
+                                            app.config.get('DAG_RENDER_PROCESSES'))
+
+        dag_rows = []
+        staged_paths = set()
+        retire_candidates = []  # (이전 파일, 대체 파일, 갱신되는 DAG id)
+        completed = False
+        try:
+            for idx, m_data in enumerate(units):
                 with open('dags_generation_debug.log', 'a') as log_file:
-                        log_file.write(f"About to write file: {filepath}\n")
-
-                # Write File
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(dag_code)
+                    log_file.write(f"Generating code for mapping {m_data['id']}\n")
                 
-                with open('dags_generation_debug.log', 'a') as log_file:
-                    log_file.write(f"File created successfully: {filepath}\n")
+                member_ids = [m['id'] for m in m_data['members']]
+                progress_info = {'mapping_id': m_data['id']}
+                if len(member_ids) > 1:
+                    progress_info['mapping_ids'] = member_ids
+                if idx in unchanged:
+                    filename = previous_dags[m_data['id']].filename
+                    skipped_files.append(filename)
+                    report_progress(idx + 1, len(units), dict(progress_info, filename=filename, skipped=True))
+                    continue
 
-                # ---------------------------------------------------------
-                # 3. DB UPDATE PHASE
-                # ---------------------------------------------------------
                 try:
+                    dag_name = m_data['dag_name']
+                    filename = f"{dag_name}.py"
+                    filepath = os.path.join(output_dir, filename)
+
+                    if rendered is not None:
+                        dag_code, render_error = next(rendered)
+                        if render_error:
+                            raise RuntimeError(render_error)
+                    else:
+                        dag_code = compiled_template.render(render_values[idx])
+                
                     with open('dags_generation_debug.log', 'a') as log_file:
-                        log_file.write(f"Attempting DB save for {m_data['id']}\n")
-                        
-                    new_dag = GeneratedDAG(
-                        filename=filename,
-                        filepath=filepath,
-                        template_id=template_id_val,
-                        mapping_id=m_data['id'],
-                        status='Generated'
-                    )
-                    db.session.add(new_dag)
-                    db.session.commit()
-                    
-                    with open('dags_generation_debug.log', 'a') as log_file:
-                        log_file.write(f"Committed DB for mapping {m_data['id']}\n")
-                        
-                except Exception as commit_e:
-                    db.session.rollback()
+                            log_file.write(f"About to write file: {filepath}\n")
+
+                    # 같은 DAG가 이미 게시돼 있으면 그 파일을 가리키고, 아니면
+                    # blob 저장소에 한 번 저장한 뒤 그 blob을 가리키는 link를 staging -> atomic rename으로 게시
+                    # (dag_name 자리만 name_key로 바꾼 코드 = name_key로 렌더링한 코드)
+                    content_key = content_digest(dag_code.replace(dag_name, m_data['name_key']))
+                    existing = published_by_key.get(content_key)
+                    if existing and (existing[1] in staged_paths or points_to_blob(output_dir, existing[1], existing[2])):
+                        filename, filepath, digest = existing
+                    else:
+                        digest = publisher.stage(filepath, dag_code)
+                        published_by_key[content_key] = (filename, filepath, digest)
+                        staged_paths.add(filepath)
+                
                     with open('dags_generation_debug.log', 'a') as log_file:
-                        log_file.write(f"WARNING: DB Commit failed for mapping {m_data['id']}: {commit_e}\n")
+                        log_file.write(f"File created successfully: {filepath}\n")
+
+                    # fan-out DAG는 묶인 mapping마다 같은 파일을 가리키는 레코드를 남김
+                    for member_id in member_ids:
+                        dag_row = {
+                            'filename': filename,
+                            'filepath': filepath,
+                            'template_id': template_id_val,
+                            'mapping_id': member_id,
+                            'status': 'Generated',
+                            'error_message': None,
+                            'fingerprint': fingerprints[idx],
+                            'content_hash': digest,
+                            'content_key': content_key,
+                        }
+                        prev = previous_dags.get(member_id)
+                        if incremental and prev:
+                            # 기존 DAG 레코드를 갱신하고 이전 파일은 정리
+                            dag_row.update(id=prev.id, created_at=datetime.now())
+                            if prev.filepath and prev.filepath != filepath:
+                                retire_candidates.append((prev.filepath, filepath, prev.id))
+                        dag_rows.append(dag_row)
                 
-                generated_files.append(filename)
-                success_count += 1
+                    generated_files.append(filename)
+                    success_count += 1
+                    report_progress(idx + 1, len(units), dict(progress_info, filename=filename))
 
-            except Exception as inner_e:
-                error_msg = str(inner_e)
-                with open('dags_generation_debug.log', 'a') as log_file:
-                    log_file.write(f"ERROR processing mapping {m_data['id']}: {error_msg}\n")
+                except Exception as inner_e:
+                    error_msg = str(inner_e)
+                    with open('dags_generation_debug.log', 'a') as log_file:
+                        log_file.write(f"ERROR processing mapping {m_data['id']}: {error_msg}\n")
                 
-                try:
-                    error_dag = GeneratedDAG(
-                        filename='Error',
-                        filepath='Error',
-                        template_id=template_id_val,
-                        mapping_id=m_data['id'],
-                        status='Error',
-                        error_message=error_msg
-                    )
-                    db.session.add(error_dag)
-                    db.session.commit()
-                except:
-                    pass
-                continue
-
-        return {'status': 'success', 'message': f'Successfully generated {success_count} DAGs.', 'generated_files': generated_files}, 200
+                    for member_id in member_ids:
+                        dag_rows.append({
+                            'filename': 'Error',
+                            'filepath': 'Error',
+                            'template_id': template_id_val,
+                            'mapping_id': member_id,
+                            'status': 'Error',
+                            'error_message': error_msg,
+                            'fingerprint': None,
+                            'content_hash': None,
+                            'content_key': None,
+                        })
+                    report_progress(idx + 1, len(units), dict(progress_info, error=error_msg))
+                    continue
+            completed = True
+        finally:
+            if rendered is not None:
+                rendered.close()
+            if not completed and publisher.batch:
+                # 취소/예외로 중단된 batch는 일부만 게시하지 않고 버림 (scheduler는 이전 파일 세트를 그대로 봄)
+                publisher.discard()
+            else:
+                # 이전 파일은 이번에 갱신되지 않는 다른 DAG 레코드가 가리키지 않을 때만 정리
+                if retire_candidates:
+                    updated_ids = {row['id'] for row in dag_rows if 'id' in row}
+                    old_paths = list({c[0] for c in retire_candidates})
+                    shared = set()
+                    for i in range(0, len(old_paths), 500):
+                        for row in db.session.query(GeneratedDAG.id, GeneratedDAG.filepath).filter(
+                                GeneratedDAG.filepath.in_(old_paths[i:i + 500])).all():
+                            if row.id not in updated_ids:
+                                shared.add(row.filepath)
+                    for old_path, new_path, dag_id in retire_candidates:
+                        if old_path not in shared:
+                            publisher.retire(old_path, new_path)
+                # 한 번에 게시: 게시에 실패한 파일은 Error로 기록
+                for failed_path, publish_error in publisher.publish().items():
+                    for row in dag_rows:
+                        if row['filepath'] == failed_path and row['status'] == 'Generated':
+                            row.update(status='Error', error_message=f'Publish failed: {publish_error}', fingerprint=None, content_hash=None, content_key=None)
+                            if row['filename'] in generated_files:
+                                generated_files.remove(row['filename'])
+                                success_count -= 1
+                for row, save_e in save_generated_dags(dag_rows):
+                    with open('dags_generation_debug.log', 'a') as log_file:
+                        log_file.write(f"WARNING: DB save failed for mapping {row['mapping_id']}: {save_e}\n")
+
+        message = f'Successfully generated {success_count} DAGs.'
+        if incremental:
+            message += f' {len(skipped_files)} unchanged DAGs skipped.'
+        result = {
+            'status': 'success',
+            'message': message,
+            'generated_files': generated_files,
+            'skipped_files': skipped_files,
+        }
+        if fan_out:
+            result['fan_out_groups'] = [[m['id'] for m in u['members']] for u in units if len(u['members']) > 1]
+        return result, 200
 
     except Exception as e:
         import traceback
@@ -1744,6 +2256,77 @@ def generate_dags():
             
         return {'status': 'error', 'message': f'Server Error: {str(e)}'}, 500
 
+# Background Job APIs
+def job_to_dict(job, include_params=False):
+    import json
+    live = get_job_manager(app).live_state(job.id) if job.status == 'Running' else None
+    if live:
+        progress_current, progress_total, partial = live['current'], live['total'], live['partial']
+    else:
+        progress_current, progress_total = job.progress_current or 0, job.progress_total
+        partial = json.loads(job.partial_results) if job.partial_results else []
+    data = {
+        'id': job.id,
+        'job_type': job.job_type,
+        'status': job.status,
+        'progress_current': progress_current,
+        'progress_total': progress_total,
+        'partial_results': partial,
+        'result': json.loads(job.result) if job.result else None,
+        'has_artifact': bool(job.artifact_path),
+        'artifact_name': job.artifact_name,
+        'error_message': job.error_message,
+        'cancel_requested': bool(job.cancel_requested),
+        'created_at': job.created_at.strftime('%Y-%m-%d %H:%M:%S') if job.created_at else None,
+        'started_at': job.started_at.strftime('%Y-%m-%d %H:%M:%S') if job.started_at else None,
+        'finished_at': job.finished_at.strftime('%Y-%m-%d %H:%M:%S') if job.finished_at else None,
+    }
+    if include_params:
+        data['params'] = json.loads(job.params) if job.params else None
+    return data
+
+@app.route('/api/jobs', methods=['GET'])
+def list_jobs():
+    limit = request.args.get('limit', 50, type=int)
+    query = BackgroundJob.query
+    if request.args.get('status'):
+        query = query.filter(BackgroundJob.status == request.args.get('status'))
+    jobs = query.order_by(BackgroundJob.id.desc()).limit(limit).all()
+    return jsonify({'status': 'success', 'jobs': [job_to_dict(j) for j in jobs]}), 200
+
+@app.route('/api/jobs/<int:id>', methods=['GET'])
+def get_job(id):
+    job = BackgroundJob.query.get(id)
+    if not job:
+        return {'status': 'error', 'message': 'Job not found'}, 404
+    return {'status': 'success', 'job': job_to_dict(job, include_params=True)}, 200
+
+@app.route('/api/jobs/<int:id>/cancel', methods=['POST'])
+def cancel_job(id):
+    job = BackgroundJob.query.get(id)
+    if not job:
+        return {'status': 'error', 'message': 'Job not found'}, 404
+    if job.status not in ('Queued', 'Running'):
+        return {'status': 'error', 'message': f'Job is already {job.status}'}, 400
+    get_job_manager(app).cancel(job.id)
+    return {'status': 'success', 'message': f'Cancellation requested for job {job.id}'}, 200
+
+@app.route('/api/jobs/<int:id>/artifact', methods=['GET'])
+def download_job_artifact(id):
+    job = BackgroundJob.query.get(id)
+    if not job:
+        return {'status': 'error', 'message': 'Job not found'}, 404
+    if job.status != 'Completed' or not job.artifact_path:
+        return {'status': 'error', 'message': 'Job has no artifact'}, 404
+    if not os.path.exists(job.artifact_path):
+        return {'status': 'error', 'message': 'Artifact file not found on server'}, 404
+    return send_file(
+        job.artifact_path,
+        as_attachment=True,
+        download_name=job.artifact_name,
+        mimetype=job.artifact_mimetype or 'application/octet-stream'
+    )
+
 @app.route('/api/operators', methods=['GET'])
 def get_operators():
     ops = CustomOperator.query.order_by(CustomOperator.updated_at.desc()).all()
@@ -1781,13 +2364,18 @@ def delete_operator(id):
 
 @app.route('/api/mappings/fetch_schemas/<int:conn_id>', methods=['GET'], strict_slashes=False)
 def api_fetch_schemas(conn_id):
+    import json
     conn = Connection.query.get_or_404(conn_id)
     schemas = []
     if conn.conn_type == 'oracle':
+        if not wants_catalog_refresh():
+            entry = catalog_cache.get_cached(conn.id, 'schemas', '', app.config['CATALOG_CACHE_TTL'])
+            if entry:
+                return {'schemas': json.loads(entry.payload), 'cache': catalog_cache.cache_info(entry, True)}, 200
+
         import oracledb
         try:
-            dsn = f"{conn.host}:{conn.port}/{conn.database}"
-            with oracledb.connect(user=conn.username, password=conn.password, dsn=dsn) as connection:
+            with acquire_connection(conn) as connection:
                 with connection.cursor() as cursor:
                     sql = """
                         SELECT username FROM dba_users 
@@ -1806,6 +2394,10 @@ def api_fetch_schemas(conn_id):
         except Exception as e:
             print(f"ERROR: Failed to fetch schemas: {e}")
             return {'status': 'error', 'message': f'Error fetching schemas: {str(e)}'}, 500
+
+        catalog_cache.put_cached(conn.id, 'schemas', '', schemas)
+        catalog_cache.commit_cache()
+        return {'schemas': schemas, 'cache': catalog_cache.cache_info(None, False)}, 200
     elif conn.conn_type == 'postgres':
         schemas = ['public', 'information_schema', 'pg_catalog']
     elif conn.conn_type == 'mysql':
@@ -1819,16 +2411,19 @@ def api_fetch_schemas(conn_id):
 
 @app.route('/api/mappings/fetch_tables/<int:conn_id>', methods=['GET'], strict_slashes=False)
 def api_fetch_tables(conn_id):
+    import json
     conn = Connection.query.get_or_404(conn_id)
     schema = request.args.get('schema')
     
     tables = []
     if conn.conn_type == 'oracle':
-        import oracledb
+        if not wants_catalog_refresh():
+            entry = catalog_cache.get_cached(conn.id, 'tables', schema or '', app.config['CATALOG_CACHE_TTL'])
+            if entry:
+                return {'tables': json.loads(entry.payload), 'cache': catalog_cache.cache_info(entry, True)}, 200
+
         try:
-            dsn = f"{conn.host}:{conn.port}/{conn.database}"
-            print(f"DEBUG: Connecting to Oracle DSN: {dsn}, User: {conn.username}")
-            with oracledb.connect(user=conn.username, password=conn.password, dsn=dsn) as connection:
+            with acquire_connection(conn) as connection:
                 with connection.cursor() as cursor:
                     if schema:
                         sql = """
@@ -1846,6 +2441,10 @@ def api_fetch_tables(conn_id):
         except Exception as e:
             print(f"ERROR: Failed to fetch Oracle tables: {e}")
             return {'status': 'error', 'message': f'Error connecting to Oracle: {str(e)}'}, 500
+
+        catalog_cache.put_cached(conn.id, 'tables', schema or '', tables)
+        catalog_cache.commit_cache()
+        return {'tables': tables, 'cache': catalog_cache.cache_info(None, False)}, 200
     elif conn.conn_type == 'postgres':
         tables = ['users', 'orders', 'products']
     elif conn.conn_type == 'mysql':
@@ -1864,9 +2463,28 @@ def api_fetch_tables(conn_id):
             if not bucket:
                  tables = ['members.csv', 'events.json', 'logs/']
             else:
-                response = s3_client.list_objects_v2(Bucket=bucket)
-                if 'Contents' in response:
-                    tables = [obj['Key'] for obj in response['Contents']]
+                # Paginated / prefix-aware listing (list_objects_v2는 호출당 최대 1,000 key)
+                from s3_browser import list_page, ndjson_listing
+                prefix = request.args.get('prefix', '')
+                delimiter = request.args.get('delimiter', '')
+                pattern = request.args.get('pattern') or None
+                token = request.args.get('token') or None
+
+                if request.args.get('stream', '').lower() in ('1', 'true', 'yes'):
+                    max_items = request.args.get('max_items', type=int)
+                    return Response(
+                        stream_with_context(ndjson_listing(s3_client, bucket, prefix, delimiter, pattern, token, max_items)),
+                        mimetype='application/x-ndjson'
+                    )
+
+                page = list_page(s3_client, bucket, prefix, delimiter, pattern, token,
+                                 page_size=request.args.get('page_size', 1000, type=int))
+                return {
+                    'tables': page['keys'],
+                    'folders': page['folders'],
+                    'prefix': prefix,
+                    'next_token': page['next_token'],
+                }, 200
         except Exception as e:
              print(f"ERROR: S3 Fetch failed: {e}")
              tables = ['error_fetching_s3_files']
@@ -1875,6 +2493,25 @@ def api_fetch_tables(conn_id):
         
     return {'tables': tables}, 200
 
+def wants_catalog_refresh():
+    return request.args.get('refresh', '').lower() in ('1', 'true', 'yes')
+
+@app.route('/api/mappings/catalog_cache/<int:conn_id>/refresh', methods=['POST'])
+def api_refresh_catalog_cache(conn_id):
+    """Drop cached catalog metadata of a connection (optionally one kind / key)."""
+    conn = Connection.query.get_or_404(conn_id)
+    data = request.get_json(silent=True) or {}
+    kind = data.get('kind')  # schemas, tables, columns
+    if kind and kind not in ('schemas', 'tables', 'columns'):
+        return {'status': 'error', 'message': f'Unknown cache kind: {kind}'}, 400
+    try:
+        deleted = catalog_cache.invalidate(conn.id, kind, data.get('key'))
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        return {'status': 'error', 'message': str(e)}, 500
+    return {'status': 'success', 'message': f'{deleted} cache entries cleared for {conn.name}', 'cleared': deleted}, 200
+
 @app.route('/api/connections', methods=['GET'])
 def api_connections():
     conns = Connection.query.order_by(Connection.name).all()
@@ -1929,5 +2566,8 @@ if __name__ == '__main__':
             )
             db.session.add(default_meta)
             db.session.commit()
+
+        # 서버 재시작으로 중단된 Background Job 정리
+        get_job_manager(app).recover_interrupted()
             
     app.run(debug=True, use_reloader=False, port=5000)
@@ -0,0 +1,119 @@
+import json
+from datetime import datetime, timedelta
+
+from models import db, CatalogCache
+
+# SQLite 변수 개수 제한을 피하기 위한 IN 조회 청크 크기
+LOOKUP_CHUNK_SIZE = 500
+
+
+def cache_info(entry, hit):
+    """Cache metadata included in API responses (entry=None means fetched just now)."""
+    if entry is None:
+        return {'hit': hit, 'fetched_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'age_seconds': 0}
+    return {
+        'hit': hit,
+        'fetched_at': entry.fetched_at.strftime('%Y-%m-%d %H:%M:%S'),
+        'age_seconds': int((datetime.now() - entry.fetched_at).total_seconds()),
+    }
+
+
+def get_cached(conn_id, kind, key, ttl):
+    """Return the fresh CatalogCache entry or None (expired entries count as misses)."""
+    entry = CatalogCache.query.filter_by(conn_id=conn_id, kind=kind, cache_key=key or '').first()
+    if entry and entry.fetched_at >= datetime.now() - timedelta(seconds=ttl):
+        return entry
+    return None
+
+
+def get_cached_many(conn_id, kind, keys, ttl):
+    """Return {key: payload} for every fresh entry among keys."""
+    keys = list(dict.fromkeys(keys))
+    cutoff = datetime.now() - timedelta(seconds=ttl)
+    result = {}
+    for i in range(0, len(keys), LOOKUP_CHUNK_SIZE):
+        chunk = keys[i:i + LOOKUP_CHUNK_SIZE]
+        rows = db.session.query(CatalogCache.cache_key, CatalogCache.payload).filter(
+            CatalogCache.conn_id == conn_id,
+            CatalogCache.kind == kind,
+            CatalogCache.cache_key.in_(chunk),
+            CatalogCache.fetched_at >= cutoff,
+        ).all()
+        for key, payload in rows:
+            result[key] = json.loads(payload)
+    return result
+
+
+def put_cached_many(conn_id, kind, entries):
+    """Upsert {key: payload} in one statement; the caller commits.
+
+    Uses INSERT ... ON CONFLICT DO UPDATE, so two requests that both missed
+    the cache for the same key don't collide on uq_catalog_cache_entry.
+    """
+    if not entries:
+        return
+    now = datetime.now()
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    elif dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        return _put_cached_many_orm(conn_id, kind, entries, now)
+
+    stmt = insert(CatalogCache)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['conn_id', 'kind', 'cache_key'],
+        set_={'payload': stmt.excluded.payload, 'fetched_at': stmt.excluded.fetched_at},
+    )
+    db.session.execute(stmt, [
+        {'conn_id': conn_id, 'kind': kind, 'cache_key': key,
+         'payload': json.dumps(payload, ensure_ascii=False), 'fetched_at': now}
+        for key, payload in entries.items()
+    ])
+
+
+def _put_cached_many_orm(conn_id, kind, entries, now):
+    """Select-then-write fallback for databases without ON CONFLICT."""
+    keys = list(entries.keys())
+    existing = {}
+    for i in range(0, len(keys), LOOKUP_CHUNK_SIZE):
+        chunk = keys[i:i + LOOKUP_CHUNK_SIZE]
+        for entry in CatalogCache.query.filter(
+            CatalogCache.conn_id == conn_id,
+            CatalogCache.kind == kind,
+            CatalogCache.cache_key.in_(chunk),
+        ).all():
+            existing[entry.cache_key] = entry
+    for key, payload in entries.items():
+        data = json.dumps(payload, ensure_ascii=False)
+        entry = existing.get(key)
+        if entry:
+            entry.payload = data
+            entry.fetched_at = now
+        else:
+            db.session.add(CatalogCache(conn_id=conn_id, kind=kind, cache_key=key, payload=data, fetched_at=now))
+
+
+def put_cached(conn_id, kind, key, payload):
+    put_cached_many(conn_id, kind, {key or '': payload})
+
+
+def commit_cache():
+    """Commit cache writes; a failed cache write is logged and rolled back, not raised."""
+    from sqlalchemy.exc import SQLAlchemyError
+    try:
+        db.session.commit()
+    except SQLAlchemyError as e:
+        db.session.rollback()
+        print(f"WARNING: Failed to store catalog cache: {e}")
+
+
+def invalidate(conn_id, kind=None, key=None):
+    """Delete cache entries of a connection (optionally one kind / key); the caller commits."""
+    query = CatalogCache.query.filter(CatalogCache.conn_id == conn_id)
+    if kind:
+        query = query.filter(CatalogCache.kind == kind)
+    if key is not None:
+        query = query.filter(CatalogCache.cache_key == key)
+    return query.delete(synchronize_session=False)
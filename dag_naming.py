@@ -0,0 +1,100 @@
+import json
+import threading
+from collections import defaultdict
+
+from models import DagNamingRule
+
+
+def safe_name(s):
+    return "".join([c if c.isalnum() or c in ('_', '-') else '_' for c in str(s or '')])
+
+
+def parse_schema_table(full_name):
+    """OWNER.TABLE_NAME 형태면 분리, 아니면 schema='', table=full_name"""
+    parts = str(full_name or '').split('.')
+    if len(parts) >= 2:
+        return parts[0], '.'.join(parts[1:])
+    return '', full_name
+
+
+def _default_name(m_data, timestamp_str):
+    return f"dag_{safe_name(m_data['source_conn_name'])}_{safe_name(m_data['source_table'])}_{timestamp_str}"
+
+
+# 규칙 토큰 type -> (m_data, timestamp_str) -> 이름 조각
+_TOKEN_PARTS = {
+    'src_schema': lambda m, ts: safe_name(parse_schema_table(m['source_table'])[0] or m['source_table'].split('.')[0]),
+    'src_table': lambda m, ts: safe_name(parse_schema_table(m['source_table'])[1] or m['source_table']),
+    'tgt_schema': lambda m, ts: safe_name(parse_schema_table(m['target_table'])[0] or m['target_table'].split('.')[0]),
+    'tgt_table': lambda m, ts: safe_name(parse_schema_table(m['target_table'])[1] or m['target_table']),
+    'src_db': lambda m, ts: safe_name(m['source_conn_name']),
+    'tgt_db': lambda m, ts: safe_name(m['target_conn_name']),
+    'timestamp': lambda m, ts: ts,
+}
+
+
+class DagNameFormatter:
+    """DAG naming rule compiled into a list of part builders.
+
+    m_data needs source_table, target_table, source_conn_name and
+    target_conn_name. Without a usable rule (or if a part fails) the
+    default dag_<source conn>_<source table>_<timestamp> name is used.
+    """
+
+    def __init__(self, rule_tokens=None, separator='_'):
+        self.separator = separator or '_'
+        self.parts = None
+        if rule_tokens:
+            try:
+                tokens = json.loads(rule_tokens) if isinstance(rule_tokens, str) else rule_tokens
+                parts = []
+                for tok in tokens:
+                    t = tok.get('type')
+                    if t == 'literal':
+                        literal = safe_name(tok.get('value', ''))
+                        parts.append(lambda m, ts, literal=literal: literal)
+                    elif t in _TOKEN_PARTS:
+                        parts.append(_TOKEN_PARTS[t])
+                self.parts = parts
+            except Exception:
+                self.parts = None
+
+    def format(self, m_data, timestamp_str, dag_id_prefix=''):
+        if self.parts is None:
+            dag_name = _default_name(m_data, timestamp_str)
+        else:
+            try:
+                dag_name = self.separator.join(p for p in (part(m_data, timestamp_str) for part in self.parts) if p)
+            except Exception:
+                dag_name = _default_name(m_data, timestamp_str)
+        if dag_id_prefix:
+            dag_name = f"{dag_id_prefix}_{dag_name}"
+        return dag_name
+
+
+_formatter = None
+_formatter_lock = threading.Lock()
+
+
+def get_naming_formatter():
+    """Formatter for the saved naming rule, built once and cached until invalidated."""
+    global _formatter
+    with _formatter_lock:
+        if _formatter is None:
+            rule = DagNamingRule.query.first()
+            _formatter = DagNameFormatter(rule.rule_tokens, rule.separator) if rule else DagNameFormatter()
+        return _formatter
+
+
+def invalidate_naming_formatter():
+    global _formatter
+    with _formatter_lock:
+        _formatter = None
+
+
+def find_duplicate_names(named_items):
+    """{name: [item, ...]} for names used by more than one item of (item, name) pairs."""
+    by_name = defaultdict(list)
+    for item, name in named_items:
+        by_name[name].append(item)
+    return {name: items for name, items in by_name.items() if len(items) > 1}
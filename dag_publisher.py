@@ -0,0 +1,114 @@
+import os
+import shutil
+import time
+import uuid
+
+from dag_store import put_blob, link_blob, points_to_blob
+
+# output_dir 아래 staging 위치 (같은 filesystem이어야 os.replace가 atomic)
+STAGING_DIRNAME = '.staging'
+STAGED_SUFFIX = '.tmp'  # Airflow는 .py 파일만 DAG로 읽으므로 staging 파일은 parse 대상이 아님
+STALE_STAGING_SECONDS = 24 * 3600
+
+
+def _fsync_dir(path):
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except (OSError, AttributeError):
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def cleanup_stale_staging(output_dir, max_age=STALE_STAGING_SECONDS):
+    """Remove staging directories left behind by crashed runs."""
+    root = os.path.join(output_dir, STAGING_DIRNAME)
+    if not os.path.isdir(root):
+        return
+    now = time.time()
+    for name in os.listdir(root):
+        path = os.path.join(root, name)
+        try:
+            if now - os.path.getmtime(path) > max_age:
+                shutil.rmtree(path, ignore_errors=True)
+        except OSError:
+            pass
+
+
+class DagPublisher:
+    """Writes DAG files to a staging directory and publishes them with atomic renames.
+
+    File contents live once in the content-addressed blob store (dag_store);
+    published .py files are read-only symlinks to those blobs.
+
+    batch=True publishes every staged file together in publish(), after the
+    whole run has been rendered; batch=False renames each file into place as
+    soon as it is staged. Either way the scheduler never sees a partially
+    written .py file. Files passed to retire() are removed after publishing.
+    A batch that is not completed is dropped with discard() instead.
+    """
+
+    def __init__(self, output_dir, batch=True):
+        self.output_dir = output_dir
+        self.batch = batch
+        self.staging_dir = os.path.join(output_dir, STAGING_DIRNAME, uuid.uuid4().hex)
+        self._staged = []  # (staged path, final path)
+        self._retired = []  # (old path, new final path)
+        cleanup_stale_staging(output_dir)
+
+    def stage(self, final_path, content, digest=None):
+        """Store content in the blob store and stage a link to it; returns the content digest.
+
+        If final_path already links to this content there is nothing to publish.
+        """
+        digest, blob = put_blob(self.output_dir, content, digest)
+        if points_to_blob(self.output_dir, final_path, digest):
+            return digest
+        os.makedirs(self.staging_dir, exist_ok=True)
+        staged_path = os.path.join(self.staging_dir, f"{len(self._staged)}_{os.path.basename(final_path)}{STAGED_SUFFIX}")
+        # link 대상은 게시될 위치 기준 상대 경로 (staging 안에서는 dangling이어도 rename 후 유효)
+        link_blob(blob, staged_path, os.path.dirname(final_path))
+        if self.batch:
+            self._staged.append((staged_path, final_path))
+        else:
+            os.replace(staged_path, final_path)
+        return digest
+
+    def retire(self, path, replaced_by):
+        """Remove path once replaced_by has been published (e.g. a renamed predecessor)."""
+        self._retired.append((path, replaced_by))
+
+    def publish(self):
+        """Rename staged files into place; returns {final_path: error} for failures."""
+        failed = {}
+        published = set()
+        for staged_path, final_path in self._staged:
+            try:
+                os.replace(staged_path, final_path)
+                published.add(final_path)
+            except OSError as e:
+                failed[final_path] = str(e)
+        self._staged = []
+        if published or not self.batch:
+            _fsync_dir(self.output_dir)
+        for path, replaced_by in self._retired:
+            if replaced_by in failed or path in published:
+                continue
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except OSError as e:
+                print(f"Warning: Could not delete file {path}: {e}")
+        self._retired = []
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+        return failed
+
+    def discard(self):
+        """Drop everything staged but not yet published."""
+        self._staged = []
+        self._retired = []
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
@@ -0,0 +1,245 @@
+import hashlib
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from models import db, GeneratedDAG, DagFileIndex
+from dag_store import blob_path, link_blob, GC_MIN_AGE_SECONDS
+
+HASH_CHUNK_SIZE = 1024 * 1024
+LOOKUP_CHUNK_SIZE = 500
+REPAIR_ACTIONS = ('missing', 'orphans', 'modified', 'backfill')
+
+# generate_dags가 만드는 파일명 (safe_name 결과 + .py, dags_output 바로 아래)
+# '_'로 시작하는 __init__.py 등과 하위 폴더의 helper module은 대상에서 제외
+GENERATED_NAME_RE = re.compile(r'^[A-Za-z0-9-][A-Za-z0-9_-]*\.py$')
+ORPHAN_MIN_AGE_SECONDS = GC_MIN_AGE_SECONDS  # 게시 직후 DB commit 전인 파일 보호
+
+
+def _hash_file(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(HASH_CHUNK_SIZE)
+            if not block:
+                break
+            h.update(block)
+    return h.hexdigest()
+
+
+def iter_dag_files(output_dir):
+    """Yield (relative path, stat) for every .py file, skipping dot directories (.blobs, .staging)."""
+    stack = [output_dir]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = list(os.scandir(current))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+            elif entry.name.endswith('.py') and entry.is_file():
+                try:
+                    yield os.path.relpath(entry.path, output_dir), entry.stat()
+                except OSError:
+                    pass
+
+
+def scan(output_dir, workers=4):
+    """Bring DagFileIndex up to date with output_dir and return {relative path: content hash}.
+
+    Files whose size, mtime and inode match the index keep their stored hash;
+    only new or changed files are read. Index rows of removed files are
+    deleted. Returns (hashes, stats) where stats counts the work done.
+    """
+    indexed = {row.path: row for row in db.session.query(
+        DagFileIndex.id, DagFileIndex.path, DagFileIndex.size, DagFileIndex.mtime_ns,
+        DagFileIndex.inode, DagFileIndex.content_hash)}
+
+    hashes = {}
+    to_hash = []  # (relative path, stat)
+    for rel_path, st in iter_dag_files(output_dir):
+        row = indexed.get(rel_path)
+        if row and row.size == st.st_size and row.mtime_ns == st.st_mtime_ns and row.inode == st.st_ino:
+            hashes[rel_path] = row.content_hash
+        else:
+            to_hash.append((rel_path, st))
+
+    # 바뀐 파일만 병렬로 hash 계산
+    def _hash(item):
+        try:
+            return _hash_file(os.path.join(output_dir, item[0]))
+        except OSError:
+            return None
+
+    now = datetime.now()
+    inserts, updates = [], []
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='reconcile') as executor:
+        for (rel_path, st), digest in zip(to_hash, executor.map(_hash, to_hash)):
+            if digest is None:
+                continue  # scan 중에 사라진 파일
+            hashes[rel_path] = digest
+            values = {'path': rel_path, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns,
+                      'inode': st.st_ino, 'content_hash': digest, 'scanned_at': now}
+            if rel_path in indexed:
+                updates.append(dict(values, id=indexed[rel_path].id))
+            else:
+                inserts.append(values)
+    removed_ids = [row.id for path, row in indexed.items() if path not in hashes]
+
+    from sqlalchemy import insert, update, delete
+    if inserts:
+        db.session.execute(insert(DagFileIndex), inserts)
+    if updates:
+        db.session.execute(update(DagFileIndex), updates)
+    for i in range(0, len(removed_ids), LOOKUP_CHUNK_SIZE):
+        db.session.execute(delete(DagFileIndex).where(DagFileIndex.id.in_(removed_ids[i:i + LOOKUP_CHUNK_SIZE])),
+                           execution_options={'synchronize_session': False})
+    db.session.commit()
+
+    return hashes, {
+        'files': len(hashes),
+        'hashed': len(inserts) + len(updates),
+        'unchanged': len(hashes) - len(inserts) - len(updates),
+        'removed_from_index': len(removed_ids),
+    }
+
+
+def diff(output_dir, hashes):
+    """Compare scanned files with GeneratedDAG rows.
+
+    Returns {'missing': [...], 'orphans': [...], 'modified': [...], 'unhashed': [...]}:
+    rows whose file is gone, files no row points at, files whose hash differs
+    from the row's content_hash, and rows without a content_hash yet.
+    """
+    output_dir = os.path.abspath(output_dir)
+    referenced = set()
+    result = {'missing': [], 'orphans': [], 'modified': [], 'unhashed': []}
+    rows = db.session.query(
+        GeneratedDAG.id, GeneratedDAG.filepath, GeneratedDAG.content_hash, GeneratedDAG.status
+    ).order_by(GeneratedDAG.id).yield_per(1000)
+    for row in rows:
+        if not row.filepath:
+            continue
+        abs_path = os.path.abspath(row.filepath)
+        if os.path.dirname(abs_path) != output_dir and not abs_path.startswith(output_dir + os.sep):
+            continue  # dags_output 밖의 파일은 대상 아님
+        rel_path = os.path.relpath(abs_path, output_dir)
+        referenced.add(rel_path)  # Error 레코드가 가리키는 파일도 참조된 것으로 봄
+        if row.status == 'Error':
+            continue
+        item = {'dag_id': row.id, 'path': rel_path}
+        digest = hashes.get(rel_path)
+        if digest is None:
+            result['missing'].append(item)
+        elif row.content_hash is None:
+            result['unhashed'].append(dict(item, content_hash=digest))
+        elif row.content_hash != digest:
+            result['modified'].append(dict(item, expected=row.content_hash, actual=digest))
+    result['orphans'] = [{'path': p, 'content_hash': hashes[p]} for p in sorted(hashes) if p not in referenced]
+    return result
+
+
+def _deletable_orphan(output_dir, item, now, min_age):
+    """Reason the orphan must be kept, or None if it may be deleted.
+
+    Only files that look like generate_dags output are deleted: a generated
+    file name at the top of dags_output, content that is in the blob store,
+    and older than min_age (newly published files get their DB rows a moment
+    later).
+    """
+    path = item['path']
+    if os.path.dirname(path) or not GENERATED_NAME_RE.match(path):
+        return 'Not a generated DAG file name'
+    if not os.path.exists(blob_path(output_dir, item['content_hash'])):
+        return 'Content was not produced by DAG generation'
+    try:
+        if now - os.path.getmtime(os.path.join(output_dir, path)) < min_age:
+            return 'Modified recently'
+    except OSError as e:
+        return str(e)
+    return None
+
+
+def repair(output_dir, report, actions, orphan_min_age=ORPHAN_MIN_AGE_SECONDS):
+    """Apply the requested repair actions to a diff() report; returns {action: count}.
+
+    missing  - mark rows whose file is gone as Error (cleanup_error_dags.py removes them)
+    orphans  - delete generated files no GeneratedDAG row points at (see _deletable_orphan)
+    modified - restore files from the blob store when an intact blob is still there
+    backfill - store the scanned hash on rows that have no content_hash
+    """
+    from sqlalchemy import update
+    done = {}
+    if 'missing' in actions and report['missing']:
+        # scan 이후 새로 게시된 파일일 수 있으므로 다시 확인
+        ids = [item['dag_id'] for item in report['missing']
+               if not os.path.exists(os.path.join(output_dir, item['path']))]
+        for i in range(0, len(ids), LOOKUP_CHUNK_SIZE):
+            db.session.execute(update(GeneratedDAG).where(GeneratedDAG.id.in_(ids[i:i + LOOKUP_CHUNK_SIZE])).values(
+                status='Error', error_message='File missing from dags_output'),
+                execution_options={'synchronize_session': False})
+        done['missing'] = len(ids)
+    if 'backfill' in actions and report['unhashed']:
+        db.session.execute(update(GeneratedDAG), [
+            {'id': item['dag_id'], 'content_hash': item['content_hash']} for item in report['unhashed']])
+        done['backfill'] = len(report['unhashed'])
+    db.session.commit()
+
+    if 'orphans' in actions:
+        removed = 0
+        now = time.time()
+        for item in report['orphans']:
+            reason = _deletable_orphan(output_dir, item, now, orphan_min_age)
+            if reason:
+                item['skipped'] = reason
+                continue
+            try:
+                os.remove(os.path.join(output_dir, item['path']))
+                removed += 1
+            except OSError as e:
+                item['error'] = str(e)
+        done['orphans'] = removed
+    if 'modified' in actions:
+        restored = 0
+        for item in report['modified']:
+            blob = blob_path(output_dir, item['expected'])
+            if not os.path.exists(blob):
+                item['error'] = 'Original content not in blob store'
+                continue
+            if _hash_file(blob) != item['expected']:
+                item['error'] = 'Blob in store does not match its hash'
+                continue
+            path = os.path.join(output_dir, item['path'])
+            try:
+                if _hash_file(path) == item['expected']:
+                    continue  # scan 이후 이미 원래 내용으로 돌아옴
+            except OSError:
+                pass
+            # 임시 link를 만든 뒤 atomic rename으로 교체
+            tmp_path = f"{path}.restore.tmp"
+            try:
+                if os.path.lexists(tmp_path):
+                    os.remove(tmp_path)
+                link_blob(blob, tmp_path, os.path.dirname(path))
+                os.replace(tmp_path, path)
+                restored += 1
+            except OSError as e:
+                item['error'] = str(e)
+        done['modified'] = restored
+    return done
+
+
+def reconcile(output_dir, actions=(), workers=4):
+    """Scan, diff and (optionally) repair; returns the report."""
+    hashes, stats = scan(output_dir, workers)
+    report = diff(output_dir, hashes)
+    repaired = repair(output_dir, report, actions) if actions else {}
+    if repaired.get('orphans') or repaired.get('modified'):
+        scan(output_dir, workers)  # 복구한 파일만 다시 index
+    return dict(report, scan=stats, repaired=repaired)
@@ -0,0 +1,161 @@
+import hashlib
+import json
+import multiprocessing
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+
+# {{ name }} 형태의 placeholder (대소문자 / 공백 무관)
+PLACEHOLDER_RE = re.compile(r'\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}')
+
+# template에서 지원하는 placeholder 이름 (정규화된 소문자) -> 렌더링 값 key
+PLACEHOLDERS = {
+    'source_sql': 'source_sql',
+    'source_table': 'source_table',
+    'target_table': 'target_table',
+    'table_name': 'target_table',
+    'source_conn': 'source_conn',
+    'target_conn': 'target_conn',
+    'dag_name': 'dag_name',
+    'schedule_interval': 'schedule_interval',
+    'catchup': 'catchup',
+    # S3 → Oracle DAG 파라미터
+    'key_prefix': 'key_prefix',
+    'file_extension': 'file_extension',
+    'csv_delimiter': 'csv_delimiter',
+    'csv_has_header': 'csv_has_header',
+    's3_file_path': 's3_file_path',
+    # fan-out: 하나의 추출 결과를 적재할 대상 목록 (Python literal)
+    'targets': 'targets',
+    'target_tables': 'target_tables',
+}
+
+COMPILED_CACHE_SIZE = 64
+RENDER_CHUNK_SIZE = 256  # process pool에 한 번에 넘기는 mapping 수
+
+
+class CompiledTemplate:
+    """A template split once into literal text and placeholder slots.
+
+    Unknown {{ ... }} expressions (e.g. Airflow macros like {{ ds }}) are kept
+    verbatim as part of the literal text.
+    """
+
+    def __init__(self, code, content_hash=None):
+        self.content_hash = content_hash
+        self.parts = []  # 짝수 index: literal, 홀수 index: 값 key
+        pos = 0
+        for m in PLACEHOLDER_RE.finditer(code):
+            key = PLACEHOLDERS.get(m.group(1).lower())
+            if key is None:
+                continue
+            self.parts.append(code[pos:m.start()])
+            self.parts.append(key)
+            pos = m.end()
+        self.parts.append(code[pos:])
+        self.keys = frozenset(self.parts[1::2])
+
+    def render(self, values):
+        """Render in a single pass; missing values render as empty strings."""
+        out = list(self.parts)
+        for i in range(1, len(out), 2):
+            value = values.get(out[i])
+            out[i] = '' if value is None else str(value)
+        return ''.join(out)
+
+
+_compiled = OrderedDict()  # (template_id, sha256) -> CompiledTemplate
+_compiled_lock = threading.Lock()
+
+
+def get_compiled_template(template_id, code):
+    """Return the compiled form of a template, cached by id and content hash."""
+    code = code or ''
+    cache_key = (template_id, hashlib.sha256(code.encode('utf-8')).hexdigest())
+    with _compiled_lock:
+        compiled = _compiled.get(cache_key)
+        if compiled is not None:
+            _compiled.move_to_end(cache_key)
+            return compiled
+    compiled = CompiledTemplate(code, cache_key[1])
+    with _compiled_lock:
+        _compiled[cache_key] = compiled
+        while len(_compiled) > COMPILED_CACHE_SIZE:
+            _compiled.popitem(last=False)
+    return compiled
+
+
+def render_template_code(code, values, template_id=None):
+    return get_compiled_template(template_id, code).render(values)
+
+
+def dag_fingerprint(template_id, compiled, values, name_key):
+    """sha256 over every input of one generated DAG.
+
+    name_key is the DAG name built with a fixed timestamp placeholder, so a
+    timestamp token in the naming rule doesn't make every run look changed.
+    """
+    payload = {
+        'template_id': template_id,
+        'template': compiled.content_hash,
+        'name': name_key,
+        'values': {k: v for k, v in values.items() if k != 'dag_name'},
+    }
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def _render_chunk(template_id, code, values_chunk):
+    """Process-pool worker: render a chunk, returning (code, error) per item."""
+    compiled = get_compiled_template(template_id, code)
+    results = []
+    for values in values_chunk:
+        try:
+            results.append((compiled.render(values), None))
+        except Exception as e:
+            results.append((None, str(e)))
+    return results
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool(workers):
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # 요청 thread가 떠 있는 상태에서 fork하지 않도록 forkserver/spawn 사용
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        return _pool
+
+
+def _reset_pool():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_render_parallel(template_id, code, values_list, workers=None):
+    """Render values_list on a shared process pool, yielding (code, error) in input order.
+
+    If the pool breaks, the remaining items are rendered in this process.
+    """
+    chunks = [values_list[i:i + RENDER_CHUNK_SIZE] for i in range(0, len(values_list), RENDER_CHUNK_SIZE)]
+    done = 0
+    try:
+        results = _get_pool(workers).map(_render_chunk, repeat(template_id), repeat(code), chunks)
+        for chunk_results in results:
+            for item in chunk_results:
+                done += 1
+                yield item
+    except BrokenProcessPool:
+        _reset_pool()
+        yield from _render_chunk(template_id, code, values_list[done:])
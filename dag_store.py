@@ -0,0 +1,145 @@
+import hashlib
+import os
+import stat
+import time
+import uuid
+
+# output_dir 아래 content-addressed blob 저장소 (.py가 아니므로 Airflow가 parse하지 않음)
+BLOB_DIRNAME = '.blobs'
+BLOB_SUFFIX = '.blob'
+GC_MIN_AGE_SECONDS = 3600  # 진행 중인 생성 작업이 막 만든 blob은 지우지 않음
+
+
+def content_digest(content):
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def blob_path(output_dir, digest):
+    return os.path.join(output_dir, BLOB_DIRNAME, digest[:2], digest + BLOB_SUFFIX)
+
+
+def file_digest(path, chunk_size=1024 * 1024):
+    """sha256 of a file's bytes, or None if it cannot be read."""
+    h = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            while True:
+                block = f.read(chunk_size)
+                if not block:
+                    break
+                h.update(block)
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+def put_blob(output_dir, content, digest=None):
+    """Store content once under its sha256; returns (digest, blob path).
+
+    Blobs are written read-only. An existing blob is only reused if its
+    bytes still hash to its name; otherwise it is rewritten.
+    """
+    digest = digest or content_digest(content)
+    path = blob_path(output_dir, digest)
+    if os.path.exists(path) and file_digest(path) == digest:
+        os.utime(path)  # GC 유예 시간 갱신
+        return digest, path
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.chmod(tmp_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+    os.replace(tmp_path, path)
+    return digest, path
+
+
+def link_blob(blob, dest, link_dir):
+    """Create dest as a symlink to the blob, relative to link_dir (the directory dest is published in).
+
+    The relative target keeps the link valid wherever dags_output is mounted.
+    The blob is read-only, so the published file cannot be edited in place.
+    """
+    os.symlink(os.path.relpath(blob, link_dir), dest)
+
+
+def points_to_blob(output_dir, path, digest):
+    """True if path is a published link to the stored blob of digest."""
+    blob = blob_path(output_dir, digest)
+    try:
+        return os.path.islink(path) and os.path.samefile(path, blob)
+    except OSError:
+        return False
+
+
+def linked_digests(output_dir):
+    """Digests of the blobs that .py links directly under output_dir point at."""
+    root = os.path.realpath(os.path.join(output_dir, BLOB_DIRNAME))
+    digests = set()
+    try:
+        entries = list(os.scandir(output_dir))
+    except OSError:
+        return digests
+    for entry in entries:
+        if entry.name.endswith('.py') and entry.is_symlink():
+            target = os.path.realpath(entry.path)
+            if target.startswith(root + os.sep) and target.endswith(BLOB_SUFFIX):
+                digests.add(os.path.basename(target)[:-len(BLOB_SUFFIX)])
+    return digests
+
+
+def iter_blobs(output_dir):
+    """Yield (digest, path) for every stored blob."""
+    root = os.path.join(output_dir, BLOB_DIRNAME)
+    if not os.path.isdir(root):
+        return
+    for prefix in os.listdir(root):
+        prefix_dir = os.path.join(root, prefix)
+        if not os.path.isdir(prefix_dir):
+            continue
+        for name in os.listdir(prefix_dir):
+            if name.endswith(BLOB_SUFFIX):
+                yield name[:-len(BLOB_SUFFIX)], os.path.join(prefix_dir, name)
+
+
+def gc_blobs(output_dir, referenced, min_age=GC_MIN_AGE_SECONDS, dry_run=False):
+    """Remove blobs whose digest is not in referenced; returns [(digest, path, size)].
+
+    Published DAG files are links to their blob, so blobs still linked from
+    dags_output are kept even when no record references them.
+    Leftover .tmp files from interrupted writes are removed as well.
+    """
+    removed = []
+    now = time.time()
+    referenced = set(referenced) | linked_digests(output_dir)
+    for digest, path in list(iter_blobs(output_dir)):
+        if digest in referenced:
+            continue
+        try:
+            st = os.stat(path)
+            if now - st.st_mtime < min_age:
+                continue
+            if not dry_run:
+                os.remove(path)
+            removed.append((digest, path, st.st_size))
+        except OSError as e:
+            print(f"Warning: Could not remove blob {path}: {e}")
+    root = os.path.join(output_dir, BLOB_DIRNAME)
+    if os.path.isdir(root) and not dry_run:
+        for prefix in os.listdir(root):
+            prefix_dir = os.path.join(root, prefix)
+            if not os.path.isdir(prefix_dir):
+                continue
+            for name in os.listdir(prefix_dir):
+                if name.endswith('.tmp'):
+                    try:
+                        if now - os.path.getmtime(os.path.join(prefix_dir, name)) > min_age:
+                            os.remove(os.path.join(prefix_dir, name))
+                    except OSError:
+                        pass
+            try:
+                os.rmdir(prefix_dir)  # 비어 있을 때만 삭제됨
+            except OSError:
+                pass
+    return removed
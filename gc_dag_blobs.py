@@ -0,0 +1,21 @@
+import os
+import sys
+
+from app import app, db, GeneratedDAG
+from dag_store import gc_blobs
+
+# 사용법: python gc_dag_blobs.py [--dry-run]
+# GeneratedDAG 레코드가 참조하지 않는 dags_output/.blobs 의 blob을 삭제 (게시된 .py link가 가리키는 blob은 유지)
+if __name__ == '__main__':
+    dry_run = '--dry-run' in sys.argv
+    with app.app_context():
+        output_dir = os.path.abspath(os.path.join(app.root_path, '..', 'dags_output'))
+        referenced = {row.content_hash for row in db.session.query(GeneratedDAG.content_hash).filter(
+            GeneratedDAG.content_hash.isnot(None)).distinct()}
+        print(f"{len(referenced)} blobs referenced by GeneratedDAG records.")
+
+        removed = gc_blobs(output_dir, referenced, dry_run=dry_run)
+        for digest, path, size in removed:
+            print(f"{'Would remove' if dry_run else 'Removed'} {path} ({size} bytes)")
+        print(f"{len(removed)} unreferenced blobs, {sum(r[2] for r in removed)} bytes "
+              f"{'would be freed' if dry_run else 'freed'}.")
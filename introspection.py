@@ -0,0 +1,43 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# 소스 Connection별 동시 조회 수 제한 (프로세스 전역)
+_conn_semaphores = {}
+_conn_semaphores_lock = threading.Lock()
+
+
+def get_connection_semaphore(conn_id, limit):
+    """Return the process-wide semaphore that bounds concurrent work per connection."""
+    with _conn_semaphores_lock:
+        sem = _conn_semaphores.get(conn_id)
+        if sem is None:
+            sem = threading.BoundedSemaphore(max(1, int(limit)))
+            _conn_semaphores[conn_id] = sem
+        return sem
+
+
+def run_bounded(fetch_fn, keys, conn_id, max_workers=8, per_conn_limit=4):
+    """Run fetch_fn(key) for every key on a thread pool.
+
+    At most per_conn_limit calls run against the same connection at once, even
+    across concurrent requests. Returns {key: (result, error)} where exactly one
+    of result/error is set.
+    """
+    keys = list(keys)
+    if not keys:
+        return {}
+    sem = get_connection_semaphore(conn_id, per_conn_limit)
+
+    def _task(key):
+        with sem:
+            try:
+                return key, fetch_fn(key), None
+            except Exception as e:
+                return key, None, e
+
+    workers = max(1, min(int(max_workers), len(keys)))
+    results = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='introspect') as executor:
+        for key, result, error in executor.map(_task, keys):
+            results[key] = (result, error)
+    return results
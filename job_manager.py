@@ -0,0 +1,223 @@
+import json
+import os
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from werkzeug.http import parse_options_header
+
+from models import db, BackgroundJob
+
+MAX_PARTIAL_RESULTS = 500  # DB에 보관하는 부분 결과 최대 개수
+PROGRESS_FLUSH_INTERVAL = 1.0  # 진행률 DB 반영 주기 (초)
+
+
+class JobCancelled(BaseException):
+    """Raised inside a running job once cancellation was requested.
+
+    Derives from BaseException so the per-item ``except Exception`` handlers in
+    the admin operations don't swallow it.
+    """
+
+
+_current = threading.local()
+
+
+def current_job_id():
+    return getattr(_current, 'job_id', None)
+
+
+def report_progress(current, total=None, partial=None):
+    """Report progress from inside an operation; no-op outside a background job.
+
+    Raises JobCancelled when the job was asked to stop.
+    """
+    job_id = current_job_id()
+    if job_id is None or _job_manager_instance is None:
+        return
+    _job_manager_instance.progress(job_id, current, total, partial)
+
+
+class JobManager:
+    def __init__(self, app, max_workers=2):
+        self.app = app
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self.artifact_dir = os.path.join(app.instance_path, 'job_artifacts')
+        self._lock = threading.Lock()
+        self._cancelled = set()
+        self._live = {}  # job_id -> in-memory progress of jobs running in this process
+        # 진행률은 별도 thread가 주기적으로 DB에 반영 (작업 thread가 SQLite lock을 기다리지 않도록)
+        self._flusher = threading.Thread(target=self._flush_loop, name='job-progress', daemon=True)
+        self._flusher.start()
+
+    def recover_interrupted(self):
+        """Mark jobs left Queued/Running by a previous server process as Failed."""
+        with self.app.app_context():
+            BackgroundJob.query.filter(BackgroundJob.status.in_(('Queued', 'Running'))).update({
+                BackgroundJob.status: 'Failed',
+                BackgroundJob.error_message: 'Interrupted by server restart',
+                BackgroundJob.finished_at: datetime.now(),
+            }, synchronize_session=False)
+            db.session.commit()
+
+    def _update(self, job_id, **values):
+        """Write job state on its own connection, independent of the job's session."""
+        table = BackgroundJob.__table__
+        try:
+            with db.engine.begin() as conn:
+                conn.execute(table.update().where(table.c.id == job_id).values(**values))
+            return True
+        except Exception as e:
+            print(f"WARNING: Could not update job {job_id}: {e}")
+            return False
+
+    def submit(self, job_type, path, payload):
+        """Persist a new job and queue it on the local worker pool."""
+        job = BackgroundJob(
+            job_type=job_type,
+            status='Queued',
+            params=json.dumps({'path': path, 'payload': payload}, ensure_ascii=False, default=str),
+        )
+        db.session.add(job)
+        db.session.commit()
+        self.executor.submit(self._run, job.id, path, payload)
+        return job
+
+    def cancel(self, job_id):
+        with self._lock:
+            self._cancelled.add(job_id)
+        self._update(job_id, cancel_requested=True)
+
+    def live_state(self, job_id):
+        with self._lock:
+            state = self._live.get(job_id)
+            return dict(state, partial=list(state['partial'])) if state else None
+
+    def progress(self, job_id, current, total, partial):
+        with self._lock:
+            state = self._live.setdefault(job_id, {'current': 0, 'total': None, 'partial': [], 'dirty': False})
+            state['current'] = current
+            if total is not None:
+                state['total'] = total
+            if partial is not None:
+                state['partial'].append(partial)
+                del state['partial'][:-MAX_PARTIAL_RESULTS]
+            state['dirty'] = True
+            cancelled = job_id in self._cancelled
+        if cancelled:
+            raise JobCancelled()
+
+    def _flush_loop(self):
+        table = BackgroundJob.__table__
+        while True:
+            time.sleep(PROGRESS_FLUSH_INTERVAL)
+            with self._lock:
+                pending = {job_id: (st['current'], st['total'], list(st['partial']))
+                           for job_id, st in self._live.items() if st['dirty']}
+                for job_id in pending:
+                    self._live[job_id]['dirty'] = False
+                running = list(self._live.keys())
+            if not running:
+                continue
+            try:
+                with self.app.app_context():
+                    for job_id, (current, total, partial) in pending.items():
+                        if not self._update(job_id, progress_current=current, progress_total=total,
+                                            partial_results=json.dumps(partial, ensure_ascii=False, default=str)):
+                            # 실패 시 다음 주기에 재시도
+                            with self._lock:
+                                if job_id in self._live:
+                                    self._live[job_id]['dirty'] = True
+                    # 다른 프로세스에서 요청된 취소도 반영
+                    with db.engine.connect() as conn:
+                        cancelled = [row[0] for row in conn.execute(
+                            db.select(table.c.id).where(table.c.id.in_(running), table.c.cancel_requested == True)
+                        )]
+                with self._lock:
+                    self._cancelled.update(cancelled)
+            except Exception as e:
+                print(f"WARNING: Job progress flush failed: {e}")
+
+    def _finish(self, job_id, status, **values):
+        state = self.live_state(job_id)
+        if state:
+            values.setdefault('progress_current', state['current'])
+            values.setdefault('progress_total', state['total'])
+            values.setdefault('partial_results', json.dumps(state['partial'], ensure_ascii=False, default=str))
+        self._update(job_id, status=status, finished_at=datetime.now(), **values)
+        with self._lock:
+            self._live.pop(job_id, None)
+            self._cancelled.discard(job_id)
+
+    def _store_artifact(self, job_id, response):
+        os.makedirs(self.artifact_dir, exist_ok=True)
+        artifact_path = os.path.join(self.artifact_dir, f'job_{job_id}')
+        response.direct_passthrough = False
+        try:
+            with open(artifact_path, 'wb') as f:
+                for chunk in response.iter_encoded():
+                    f.write(chunk)
+        except BaseException:
+            # 취소(JobCancelled) 또는 오류로 중단된 파일은 가리킬 job이 없으므로 삭제
+            try:
+                os.remove(artifact_path)
+            except OSError:
+                pass
+            raise
+        finally:
+            response.close()
+        _, options = parse_options_header(response.headers.get('Content-Disposition', ''))
+        return {
+            'artifact_path': artifact_path,
+            'artifact_name': options.get('filename') or f'job_{job_id}',
+            'artifact_mimetype': response.mimetype,
+        }
+
+    def _run(self, job_id, path, payload):
+        with self.app.app_context():
+            with self._lock:
+                cancelled = job_id in self._cancelled
+            if cancelled:
+                self._finish(job_id, 'Cancelled')
+                return
+
+            self._update(job_id, status='Running', started_at=datetime.now())
+            _current.job_id = job_id
+            try:
+                # 원래 HTTP 요청과 동일한 view를 worker thread에서 실행
+                with self.app.test_request_context(path, method='POST', json=payload):
+                    response = self.app.full_dispatch_request()
+                    status = 'Completed' if response.status_code < 400 else 'Failed'
+                    if response.mimetype == 'application/json':
+                        result = response.get_json(silent=True)
+                        error = result.get('message') if status == 'Failed' and isinstance(result, dict) else None
+                        self._finish(job_id, status, result=json.dumps(result, ensure_ascii=False, default=str),
+                                     error_message=error)
+                    elif status == 'Completed':
+                        self._finish(job_id, status, **self._store_artifact(job_id, response))
+                    else:
+                        self._finish(job_id, status, error_message=response.get_data(as_text=True)[:2000])
+            except JobCancelled:
+                db.session.rollback()
+                self._finish(job_id, 'Cancelled')
+            except Exception as e:
+                db.session.rollback()
+                traceback.print_exc()
+                self._finish(job_id, 'Failed', error_message=str(e))
+            finally:
+                _current.job_id = None
+                db.session.remove()
+
+
+_job_manager_instance = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager(app):
+    global _job_manager_instance
+    with _job_manager_lock:
+        if _job_manager_instance is None:
+            _job_manager_instance = JobManager(app, max_workers=app.config.get('JOB_MAX_WORKERS', 2))
+    return _job_manager_instance
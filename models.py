@@ -27,6 +27,8 @@ class Mapping(db.Model):
     target_table = db.Column(db.String(255), nullable=False)
     source_table_desc = db.Column(db.String(500), nullable=True)  # Table COMMENTS from DB
     status = db.Column(db.String(50), default='Draft')
+    source_sql = db.Column(db.Text, nullable=True)  # Rendered extraction SELECT (re-rendered when its columns change)
+    source_sql_version = db.Column(db.Integer, default=0)  # Bumped whenever source_sql is re-rendered
     created_at = db.Column(db.DateTime, default=db.func.current_timestamp())
 
     source_conn = db.relationship('Connection', foreign_keys=[source_conn_id], backref='source_mappings')
@@ -38,7 +40,7 @@ class Mapping(db.Model):
 
 class MappingColumn(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    mapping_id = db.Column(db.Integer, db.ForeignKey('mapping.id'), nullable=False)
+    mapping_id = db.Column(db.Integer, db.ForeignKey('mapping.id', ondelete='CASCADE'), nullable=False, index=True)
     source_column = db.Column(db.String(255), nullable=False)
     source_type = db.Column(db.String(50))
     is_pk = db.Column(db.Boolean, default=False)
@@ -81,10 +83,13 @@ class GeneratedDAG(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     filename = db.Column(db.String(255), nullable=False)
     filepath = db.Column(db.String(500), nullable=False)
-    template_id = db.Column(db.Integer, db.ForeignKey('template.id'), nullable=True) # Nullable in case template is deleted
-    mapping_id = db.Column(db.Integer, db.ForeignKey('mapping.id'), nullable=True) # Link to source mapping
+    template_id = db.Column(db.Integer, db.ForeignKey('template.id', ondelete='SET NULL'), nullable=True) # Nullable in case template is deleted
+    mapping_id = db.Column(db.Integer, db.ForeignKey('mapping.id', ondelete='SET NULL'), nullable=True, index=True) # Link to source mapping
     status = db.Column(db.String(50), default='Generated') # Generated, Deployed, Error
     error_message = db.Column(db.Text, nullable=True) # To store error details if failed
+    fingerprint = db.Column(db.String(64), nullable=True, index=True) # sha256 of all generation inputs
+    content_hash = db.Column(db.String(64), nullable=True, index=True) # sha256 of the generated code (blob in dags_output/.blobs)
+    content_key = db.Column(db.String(64), nullable=True, index=True) # sha256 of the code rendered with the timestamp-free DAG name
     created_at = db.Column(db.DateTime, default=db.func.current_timestamp())
 
     template = db.relationship('Template', backref='generated_dags')
@@ -127,3 +132,49 @@ class CustomOperator(db.Model):
 
     def __repr__(self):
         return f'<CustomOperator {self.name}>'
+
+class BackgroundJob(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    job_type = db.Column(db.String(50), nullable=False)  # generate_mapping, generate_dags, download_excel, bulk_download_dags, reconcile_dags
+    status = db.Column(db.String(20), default='Queued')  # Queued, Running, Completed, Failed, Cancelled
+    params = db.Column(db.Text, nullable=True)  # JSON: request path + payload
+    progress_current = db.Column(db.Integer, default=0)
+    progress_total = db.Column(db.Integer, nullable=True)
+    partial_results = db.Column(db.Text, nullable=True)  # JSON list of per-item results so far
+    result = db.Column(db.Text, nullable=True)  # JSON response of the finished operation
+    artifact_path = db.Column(db.String(500), nullable=True)  # File output (Excel, ZIP)
+    artifact_name = db.Column(db.String(255), nullable=True)
+    artifact_mimetype = db.Column(db.String(100), nullable=True)
+    error_message = db.Column(db.Text, nullable=True)
+    cancel_requested = db.Column(db.Boolean, default=False)
+    created_at = db.Column(db.DateTime, default=db.func.current_timestamp())
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    def __repr__(self):
+        return f'<BackgroundJob {self.id} {self.job_type} {self.status}>'
+
+class CatalogCache(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    conn_id = db.Column(db.Integer, nullable=False, index=True)  # Connection.id (cleared on edit/delete)
+    kind = db.Column(db.String(20), nullable=False)  # schemas, tables, columns
+    cache_key = db.Column(db.String(500), nullable=False, default='')  # '' / schema / OWNER.TABLE or S3 key
+    payload = db.Column(db.Text, nullable=False)  # JSON
+    fetched_at = db.Column(db.DateTime, nullable=False)
+
+    __table_args__ = (db.UniqueConstraint('conn_id', 'kind', 'cache_key', name='uq_catalog_cache_entry'),)
+
+    def __repr__(self):
+        return f'<CatalogCache {self.conn_id} {self.kind} {self.cache_key}>'
+
+class DagFileIndex(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    path = db.Column(db.String(500), nullable=False, unique=True)  # dags_output 기준 상대 경로
+    size = db.Column(db.BigInteger, nullable=False)
+    mtime_ns = db.Column(db.BigInteger, nullable=False)
+    inode = db.Column(db.BigInteger, nullable=True)
+    content_hash = db.Column(db.String(64), nullable=False)  # sha256 of the file (same as GeneratedDAG.content_hash)
+    scanned_at = db.Column(db.DateTime, nullable=False)
+
+    def __repr__(self):
+        return f'<DagFileIndex {self.path}>'
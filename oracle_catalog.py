@@ -0,0 +1,146 @@
+# Oracle은 IN 목록에 최대 1000개의 표현식만 허용하므로 청크 단위로 나눠서 조회
+IN_LIST_CHUNK_SIZE = 500
+
+
+def format_oracle_type(data_type, data_length, data_precision, data_scale):
+    """Format ALL_TAB_COLUMNS type info into a readable type string."""
+    if data_type in ('VARCHAR2', 'CHAR', 'NVARCHAR2', 'NCHAR'):
+        return f"{data_type}({data_length})"
+    elif data_type == 'NUMBER':
+        if data_precision and data_scale and data_scale > 0:
+            return f"DECIMAL({data_precision},{data_scale})"
+        elif data_precision:
+            return f"NUMBER({data_precision})"
+        else:
+            return "INTEGER"
+    elif data_type in ('FLOAT', 'BINARY_FLOAT', 'BINARY_DOUBLE'):
+        return data_type
+    elif data_type == 'DATE':
+        return 'DATE'
+    elif 'TIMESTAMP' in data_type:
+        return 'TIMESTAMP'
+    elif data_type in ('CLOB', 'NCLOB', 'LONG'):
+        return 'TEXT'
+    elif data_type in ('BLOB', 'RAW', 'LONG RAW'):
+        return data_type
+    else:
+        return data_type
+
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _in_clause(column, names):
+    """Build an IN (...) clause with named binds for a chunk of table names."""
+    binds = {f't{i}': name for i, name in enumerate(names)}
+    placeholders = ', '.join(f':{key}' for key in binds)
+    return f"{column} IN ({placeholders})", binds
+
+
+def harvest_owner_metadata(connection, owner, table_names):
+    """Fetch table/column metadata for many tables of one owner in a single session.
+
+    Runs the five catalog queries set-based (one per IN-list chunk) and splits the
+    rows per table in memory. Returns {table_name: {'table_comment', 'columns'}};
+    tables that don't exist are simply absent from the result.
+    """
+    table_names = list(dict.fromkeys(t.upper() for t in table_names))
+    table_comments = {}
+    pk_columns = {}
+    partition_columns = {}
+    col_comments = {}
+    columns = {}
+
+    with connection.cursor() as cursor:
+        cursor.arraysize = 1000
+        for chunk in _chunks(table_names, IN_LIST_CHUNK_SIZE):
+            # 1. Table COMMENTS
+            cond, binds = _in_clause('table_name', chunk)
+            cursor.execute(f"""
+                SELECT table_name, comments FROM ALL_TAB_COMMENTS
+                WHERE owner = :owner AND {cond} AND table_type = 'TABLE'
+            """, {'owner': owner, **binds})
+            for tbl, comment in cursor.fetchall():
+                table_comments[tbl] = comment or ''
+
+            # 2. PK columns
+            cond, binds = _in_clause('cons.table_name', chunk)
+            cursor.execute(f"""
+                SELECT cons.table_name, cols.column_name
+                FROM ALL_CONSTRAINTS cons
+                JOIN ALL_CONS_COLUMNS cols
+                  ON cons.constraint_name = cols.constraint_name AND cons.owner = cols.owner
+                WHERE cons.constraint_type = 'P'
+                  AND cons.owner = :owner AND {cond}
+            """, {'owner': owner, **binds})
+            for tbl, col in cursor.fetchall():
+                pk_columns.setdefault(tbl, set()).add(col)
+
+            # 3. Partition key columns
+            cond, binds = _in_clause('name', chunk)
+            cursor.execute(f"""
+                SELECT name, column_name
+                FROM ALL_PART_KEY_COLUMNS
+                WHERE owner = :owner AND {cond} AND object_type = 'TABLE'
+            """, {'owner': owner, **binds})
+            for tbl, col in cursor.fetchall():
+                partition_columns.setdefault(tbl, set()).add(col)
+
+            # 4. Column COMMENTS
+            cond, binds = _in_clause('table_name', chunk)
+            cursor.execute(f"""
+                SELECT table_name, column_name, comments FROM ALL_COL_COMMENTS
+                WHERE owner = :owner AND {cond}
+            """, {'owner': owner, **binds})
+            for tbl, col, comment in cursor.fetchall():
+                col_comments.setdefault(tbl, {})[col] = comment or ''
+
+            # 5. Column metadata
+            cursor.execute(f"""
+                SELECT table_name, column_name, data_type, data_length, data_precision,
+                       data_scale, nullable
+                FROM ALL_TAB_COLUMNS
+                WHERE owner = :owner AND {cond}
+                ORDER BY table_name, column_id
+            """, {'owner': owner, **binds})
+            for tbl, col_name, data_type, data_length, data_precision, data_scale, nullable in cursor.fetchall():
+                columns.setdefault(tbl, []).append({
+                    'name': col_name,
+                    'type': format_oracle_type(data_type, data_length, data_precision, data_scale),
+                    'is_pk': col_name in pk_columns.get(tbl, ()),
+                    'is_nullable': nullable == 'Y',
+                    'is_partition': col_name in partition_columns.get(tbl, ()),
+                    'comment': col_comments.get(tbl, {}).get(col_name, ''),
+                })
+
+    result = {}
+    for tbl in table_names:
+        if tbl not in columns and tbl not in table_comments:
+            continue
+        result[tbl] = {
+            'table_comment': table_comments.get(tbl, ''),
+            'columns': columns.get(tbl, []),
+        }
+    return result
+
+
+def fetch_table_metadata(connection, owner, table_name):
+    """Fetch metadata for a single table (same shape as one harvest entry)."""
+    harvested = harvest_owner_metadata(connection, owner, [table_name])
+    return harvested.get(table_name.upper(), {'table_comment': '', 'columns': []})
+
+
+def harvest_metadata(conn_obj, tables_by_owner):
+    """Harvest metadata for {owner: [table, ...]} using one pooled Oracle session.
+
+    Returns {(owner, table_name): metadata}.
+    """
+    from oracle_pool import acquire_connection
+    result = {}
+    with acquire_connection(conn_obj) as connection:
+        for owner, table_names in tables_by_owner.items():
+            for tbl, meta in harvest_owner_metadata(connection, owner, table_names).items():
+                result[(owner, tbl)] = meta
+    return result
@@ -0,0 +1,179 @@
+import hashlib
+import threading
+import time
+from contextlib import contextmanager
+
+# 기본 Pool 설정 (app.py에서 configure_pools로 덮어씀)
+_settings = {
+    'min': 1,
+    'max': 4,
+    'increment': 1,
+    'idle_timeout': 300,  # 초: Pool 내부 유휴 세션 정리 + 미사용 Pool 자체 정리
+}
+
+_pools = {}  # (kind, id) -> {'pool', 'fingerprint', 'last_used', 'checked_out', 'retired'}
+_pools_lock = threading.Lock()
+
+
+def configure_pools(**settings):
+    _settings.update({k: v for k, v in settings.items() if v is not None})
+
+
+def pool_key(conn_obj):
+    """Registry key: ('Connection', id) or ('MetaDB', id)."""
+    return (type(conn_obj).__name__, conn_obj.id)
+
+
+def _fingerprint(conn_obj):
+    raw = f"{conn_obj.host}|{conn_obj.port}|{conn_obj.database}|{conn_obj.username}|{conn_obj.password}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def _close(entry):
+    try:
+        entry['pool'].close(force=True)
+    except Exception as e:
+        print(f"WARNING: Failed to close Oracle pool: {e}")
+
+
+def _retire(entry):
+    """Mark a removed entry for closing; returns it if it can be closed now (caller holds the lock).
+
+    Pools with sessions still checked out are closed by the last release instead.
+    """
+    entry['retired'] = True
+    return entry if entry['checked_out'] == 0 else None
+
+
+def _in_use(entry):
+    if entry['checked_out'] > 0:
+        return True
+    try:
+        return (entry['pool'].busy or 0) > 0
+    except Exception:
+        return False
+
+
+def _sweep_idle(now):
+    """Remove pools unused within idle_timeout and not in use; returns them for closing (caller holds the lock)."""
+    expired = [key for key, entry in _pools.items()
+               if now - entry['last_used'] > _settings['idle_timeout'] and not _in_use(entry)]
+    return [_pools.pop(key) for key in expired]
+
+
+def _create_pool(conn_obj):
+    import oracledb
+    return oracledb.create_pool(
+        user=conn_obj.username,
+        password=conn_obj.password,
+        dsn=f"{conn_obj.host}:{conn_obj.port}/{conn_obj.database}",
+        min=_settings['min'],
+        max=_settings['max'],
+        increment=_settings['increment'],
+        timeout=_settings['idle_timeout'],
+        getmode=oracledb.POOL_GETMODE_WAIT,
+    )
+
+
+def _get_entry(conn_obj, checkout=False):
+    """Registry entry for a Connection/MetaDB, creating the pool on first use.
+
+    The pool is created outside the registry lock so an unreachable host
+    doesn't block pool access for every other connection.
+    """
+    key = pool_key(conn_obj)
+    fingerprint = _fingerprint(conn_obj)
+    to_close = []
+    new_pool = None
+    try:
+        while True:
+            with _pools_lock:
+                now = time.monotonic()
+                to_close.extend(_sweep_idle(now))
+                entry = _pools.get(key)
+                if entry and entry['fingerprint'] != fingerprint:
+                    # 접속 정보가 바뀐 경우 (다른 경로로 수정된 경우 포함)
+                    to_close.append(_retire(_pools.pop(key)))
+                    entry = None
+                if entry is None and new_pool is not None:
+                    entry = {'pool': new_pool, 'fingerprint': fingerprint, 'last_used': now,
+                             'checked_out': 0, 'retired': False}
+                    _pools[key] = entry
+                    new_pool = None
+                if entry is not None:
+                    entry['last_used'] = now
+                    if checkout:
+                        entry['checked_out'] += 1
+                    return entry
+            new_pool = _create_pool(conn_obj)
+    finally:
+        if new_pool is not None:
+            # 다른 thread가 먼저 만든 Pool을 사용하게 된 경우
+            to_close.append({'pool': new_pool})
+        for old in to_close:
+            if old:
+                _close(old)
+
+
+def get_pool(conn_obj):
+    """Return the shared pool for a Connection/MetaDB, creating it on first use."""
+    return _get_entry(conn_obj)['pool']
+
+
+@contextmanager
+def acquire_connection(conn_obj):
+    """Borrow a session from the shared pool; it is released back on exit.
+
+    While the session is out the pool counts as in use, so the idle sweep
+    never closes it under a long-running query.
+    """
+    entry = _get_entry(conn_obj, checkout=True)
+    connection = None
+    try:
+        connection = entry['pool'].acquire()
+        yield connection
+    finally:
+        try:
+            if connection is not None:
+                entry['pool'].release(connection)
+        finally:
+            with _pools_lock:
+                entry['checked_out'] -= 1
+                entry['last_used'] = time.monotonic()
+                close_now = entry['retired'] and entry['checked_out'] == 0
+            if close_now:
+                _close(entry)
+
+
+def evict_pool(kind, obj_id):
+    """Close and forget the pool of an edited or deleted Connection/MetaDB."""
+    with _pools_lock:
+        entry = _pools.pop((kind, obj_id), None)
+        entry = _retire(entry) if entry else None
+    if entry:
+        _close(entry)
+
+
+def close_all_pools():
+    with _pools_lock:
+        entries = [_retire(entry) for entry in _pools.values()]
+        _pools.clear()
+    for entry in entries:
+        if entry:
+            _close(entry)
+
+
+def pool_stats():
+    with _pools_lock:
+        stats = []
+        for (kind, obj_id), entry in _pools.items():
+            pool = entry['pool']
+            stats.append({
+                'kind': kind,
+                'id': obj_id,
+                'opened': getattr(pool, 'opened', None),
+                'busy': getattr(pool, 'busy', None),
+                'checked_out': entry['checked_out'],
+                'idle_seconds': round(time.monotonic() - entry['last_used'], 1),
+            })
+        return stats
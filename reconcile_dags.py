@@ -0,0 +1,33 @@
+import os
+import sys
+
+from app import app, db
+from dag_reconcile import reconcile, REPAIR_ACTIONS
+
+# 사용법: python reconcile_dags.py [--repair missing,orphans,modified,backfill]
+# dags_output 파일과 GeneratedDAG 레코드를 비교 (index는 incremental하게 갱신)
+if __name__ == '__main__':
+    actions = []
+    if '--repair' in sys.argv:
+        idx = sys.argv.index('--repair')
+        actions = sys.argv[idx + 1].split(',') if idx + 1 < len(sys.argv) else list(REPAIR_ACTIONS)
+    unknown = [a for a in actions if a not in REPAIR_ACTIONS]
+    if unknown:
+        print(f"Unknown repair action(s): {', '.join(unknown)}")
+        sys.exit(1)
+
+    with app.app_context():
+        db.create_all()
+        output_dir = os.path.abspath(os.path.join(app.root_path, '..', 'dags_output'))
+        os.makedirs(output_dir, exist_ok=True)
+        report = reconcile(output_dir, actions)
+
+        scan = report['scan']
+        print(f"Scanned {scan['files']} files ({scan['hashed']} hashed, {scan['unchanged']} unchanged, "
+              f"{scan['removed_from_index']} removed from index).")
+        for kind in ('missing', 'orphans', 'modified', 'unhashed'):
+            print(f"{kind}: {len(report[kind])}")
+            for item in report[kind][:20]:
+                print(f"  {item}")
+        if report['repaired']:
+            print(f"Repaired: {report['repaired']}")
@@ -0,0 +1,96 @@
+import fnmatch
+import json
+
+S3_MAX_PAGE_SIZE = 1000  # list_objects_v2 MaxKeys 상한
+S3_MAX_SCAN_PAGES = 10  # filter 적용 시 한 번의 요청에서 훑는 최대 page 수
+
+
+def _matches(key, pattern):
+    if not pattern:
+        return True
+    # 전체 key 또는 파일명 기준, 대소문자 무시
+    key = key.lower()
+    pattern = pattern.lower()
+    return fnmatch.fnmatchcase(key, pattern) or fnmatch.fnmatchcase(key.rsplit('/', 1)[-1], pattern)
+
+
+def iter_listing(client, bucket, prefix='', delimiter='', pattern=None, token=None,
+                 page_size=S3_MAX_PAGE_SIZE, max_items=None, max_scan_pages=None):
+    """Walk list_objects_v2 pages lazily, yielding one event at a time.
+
+    Events: ('folder', prefix), ('key', {'key', 'size', 'last_modified'}) and a final
+    ('end', next_token) where next_token resumes the listing (None when exhausted).
+    Only the current page is ever held in memory.
+    """
+    page_size = max(1, min(int(page_size or S3_MAX_PAGE_SIZE), S3_MAX_PAGE_SIZE))
+    emitted = 0
+    scanned = 0
+    while True:
+        kwargs = {'Bucket': bucket, 'Prefix': prefix or '', 'MaxKeys': page_size}
+        if delimiter:
+            kwargs['Delimiter'] = delimiter
+        if token:
+            kwargs['ContinuationToken'] = token
+        response = client.list_objects_v2(**kwargs)
+        scanned += 1
+
+        for common in response.get('CommonPrefixes', []):
+            if not _matches(common['Prefix'].rstrip('/'), pattern):
+                continue  # 폴더도 key와 같은 pattern으로 filter
+            yield 'folder', common['Prefix']
+            emitted += 1
+        for obj in response.get('Contents', []):
+            key = obj['Key']
+            if key == prefix or not _matches(key, pattern):
+                continue  # folder marker 자체 / filter 불일치
+            last_modified = obj.get('LastModified')
+            yield 'key', {
+                'key': key,
+                'size': obj.get('Size'),
+                'last_modified': last_modified.strftime('%Y-%m-%d %H:%M:%S') if last_modified else None,
+            }
+            emitted += 1
+
+        token = response.get('NextContinuationToken') if response.get('IsTruncated') else None
+        if not token:
+            break
+        if max_items is not None and emitted >= max_items:
+            break
+        if max_scan_pages is not None and scanned >= max_scan_pages:
+            break
+    yield 'end', token
+
+
+def list_page(client, bucket, prefix='', delimiter='', pattern=None, token=None, page_size=S3_MAX_PAGE_SIZE):
+    """Return one browser page: keys, folders and the token for the next page."""
+    keys = []
+    folders = []
+    next_token = None
+    # filter가 없으면 S3 page 하나 = 응답 page 하나, filter가 있으면 결과가 찰 때까지 몇 page 더 훑음
+    max_scan_pages = S3_MAX_SCAN_PAGES if pattern else 1
+    for kind, value in iter_listing(client, bucket, prefix, delimiter, pattern, token,
+                                    page_size=page_size, max_items=page_size, max_scan_pages=max_scan_pages):
+        if kind == 'folder':
+            folders.append(value)
+        elif kind == 'key':
+            keys.append(value['key'])
+        else:
+            next_token = value
+    return {'keys': keys, 'folders': folders, 'next_token': next_token}
+
+
+def ndjson_listing(client, bucket, prefix='', delimiter='', pattern=None, token=None, max_items=None):
+    """NDJSON lines for the streaming browser (one object per line)."""
+    count = 0
+    try:
+        for kind, value in iter_listing(client, bucket, prefix, delimiter, pattern, token, max_items=max_items):
+            if kind == 'folder':
+                yield json.dumps({'type': 'folder', 'prefix': value}, ensure_ascii=False) + '\n'
+                count += 1
+            elif kind == 'key':
+                yield json.dumps(dict(value, type='key'), ensure_ascii=False) + '\n'
+                count += 1
+            else:
+                yield json.dumps({'type': 'end', 'next_token': value, 'count': count}) + '\n'
+    except Exception as e:
+        yield json.dumps({'type': 'error', 'message': str(e)}, ensure_ascii=False) + '\n'
@@ -0,0 +1,301 @@
+import io
+import re
+import struct
+
+PARQUET_MAGIC = b'PAR1'
+PARQUET_ENCRYPTED_MAGIC = b'PARE'
+PARQUET_TAIL_SIZE = 8  # 4-byte footer length (little endian) + magic
+
+
+def read_parquet_footer(client, bucket, key):
+    """Download only the Parquet footer (FileMetaData + tail) with ranged GETs.
+
+    Returns footer bytes followed by the 8-byte tail. Nothing before the footer
+    (i.e. no row group data) is ever requested.
+    """
+    tail = client.get_object(Bucket=bucket, Key=key, Range=f'bytes=-{PARQUET_TAIL_SIZE}')['Body'].read()
+    if len(tail) != PARQUET_TAIL_SIZE:
+        raise ValueError(f"File too small to be Parquet: {key}")
+    if tail[4:] == PARQUET_ENCRYPTED_MAGIC:
+        raise ValueError(f"Encrypted Parquet footer is not supported: {key}")
+    if tail[4:] != PARQUET_MAGIC:
+        raise ValueError(f"Not a Parquet file (missing PAR1 footer magic): {key}")
+
+    footer_len = struct.unpack('<I', tail[:4])[0]
+    footer = client.get_object(Bucket=bucket, Key=key, Range=f'bytes=-{footer_len + PARQUET_TAIL_SIZE}')['Body'].read()
+    if len(footer) != footer_len + PARQUET_TAIL_SIZE:
+        raise ValueError(f"Truncated Parquet footer: {key}")
+    return footer
+
+
+def parquet_schema_from_footer(footer):
+    """Parse an Arrow schema from footer bytes (as returned by read_parquet_footer)."""
+    import pyarrow.parquet as pq
+    # 선두 magic만 붙이면 footer만으로 유효한 Parquet 파일 형태가 됨 (row group 데이터는 읽지 않음)
+    return pq.read_schema(io.BytesIO(PARQUET_MAGIC + footer))
+
+
+_TIMESTAMP_PRECISION = {'s': 0, 'ms': 3, 'us': 6, 'ns': 9}
+
+
+def arrow_type_to_source_type(arrow_type):
+    """Map an Arrow type from a Parquet schema to a precise source type string."""
+    import pyarrow.types as pat
+
+    if pat.is_dictionary(arrow_type):
+        return arrow_type_to_source_type(arrow_type.value_type)
+    if pat.is_boolean(arrow_type):
+        return 'BOOLEAN'
+    if pat.is_int8(arrow_type) or pat.is_int16(arrow_type) or pat.is_uint8(arrow_type):
+        return 'NUMBER(5)'
+    if pat.is_int32(arrow_type) or pat.is_uint16(arrow_type):
+        return 'NUMBER(10)'
+    if pat.is_int64(arrow_type) or pat.is_uint32(arrow_type):
+        return 'NUMBER(19)'
+    if pat.is_uint64(arrow_type):
+        return 'NUMBER(20)'
+    if pat.is_float16(arrow_type) or pat.is_float32(arrow_type):
+        return 'BINARY_FLOAT'
+    if pat.is_float64(arrow_type):
+        return 'BINARY_DOUBLE'
+    if pat.is_decimal(arrow_type):
+        if arrow_type.scale > 0:
+            return f"DECIMAL({arrow_type.precision},{arrow_type.scale})"
+        return f"NUMBER({arrow_type.precision})"
+    if pat.is_timestamp(arrow_type):
+        type_str = f"TIMESTAMP({_TIMESTAMP_PRECISION.get(arrow_type.unit, 6)})"
+        return f"{type_str} WITH TIME ZONE" if arrow_type.tz else type_str
+    if pat.is_date(arrow_type):
+        return 'DATE'
+    if pat.is_time(arrow_type):
+        return 'VARCHAR2(18)'  # HH24:MI:SS.FF9
+    if pat.is_string(arrow_type) or pat.is_large_string(arrow_type):
+        return 'VARCHAR2(4000)'
+    if pat.is_fixed_size_binary(arrow_type) and arrow_type.byte_width <= 2000:
+        return f"RAW({arrow_type.byte_width})"
+    if pat.is_binary(arrow_type) or pat.is_large_binary(arrow_type) or pat.is_fixed_size_binary(arrow_type):
+        return 'BLOB'
+    if pat.is_nested(arrow_type):
+        return 'CLOB'  # list/struct/map 은 JSON 텍스트로 적재
+    return 'VARCHAR2(4000)'
+
+
+def infer_parquet_columns(client, bucket, key):
+    """Column metadata for a Parquet object, read from its footer only."""
+    schema = parquet_schema_from_footer(read_parquet_footer(client, bucket, key))
+    columns = []
+    for field in schema:
+        columns.append({
+            'name': str(field.name).strip(),
+            'type': arrow_type_to_source_type(field.type),
+            'is_pk': False,
+            'is_nullable': field.nullable,
+            'is_partition': False,
+            'comment': '',
+        })
+    return columns
+
+
+# ---------------------------------------------------------
+# CSV: 여러 구간(head / middle / tail)을 byte budget 내에서 샘플링
+# ---------------------------------------------------------
+CSV_SAMPLE_BYTES = 1024 * 1024  # 전체 샘플링 byte budget
+CSV_SAMPLE_RANGES = 3
+CSV_MAX_SAMPLE_ROWS = 5000
+CSV_DELIMITERS = ',;\t|'
+CSV_FALLBACK_ENCODINGS = ('utf-8', 'cp949', 'latin-1')
+
+_INT_WIDTHS = (5, 10, 19, 38)
+_VARCHAR_WIDTHS = (50, 100, 255, 500, 1000, 2000, 4000)
+
+_DECIMAL_RE = re.compile(r'^([-+]?\d+)(?:\.(\d+))?$')
+_DATE_RE = re.compile(r'^\d{4}[-/.]\d{2}[-/.]\d{2}$')
+_TIMESTAMP_RE = re.compile(r'^\d{4}[-/.]\d{2}[-/.]\d{2}[ T]\d{2}:\d{2}(?::\d{2}(?:\.(\d{1,9}))?)?(?:Z|[+-]\d{2}:?\d{2})?$')
+
+
+def _ranged_get(client, bucket, key, start, end):
+    return client.get_object(Bucket=bucket, Key=key, Range=f'bytes={start}-{end}')['Body'].read()
+
+
+def sample_csv_segments(client, bucket, key, byte_budget=CSV_SAMPLE_BYTES, ranges=CSV_SAMPLE_RANGES):
+    """Fetch up to byte_budget bytes spread over head/middle/tail, aligned to line boundaries.
+
+    Returns a list of byte segments; the first one starts at the header line.
+    """
+    size = client.head_object(Bucket=bucket, Key=key)['ContentLength']
+    if size <= byte_budget:
+        return [_ranged_get(client, bucket, key, 0, max(size - 1, 0))] if size else [b'']
+
+    chunk = byte_budget // max(ranges, 1)
+    segments = []
+    for i in range(ranges):
+        # head는 0부터, 나머지는 파일 전체에 균등 분포 (마지막은 파일 끝)
+        start = 0 if i == 0 else (size - chunk if i == ranges - 1 else (size * i) // (ranges - 1) - chunk // 2)
+        start = max(0, min(start, size - chunk))
+        end = start + chunk - 1
+        data = _ranged_get(client, bucket, key, start, end)
+        if start > 0:
+            # 잘린 첫 줄 제거
+            newline = data.find(b'\n')
+            data = data[newline + 1:] if newline >= 0 else b''
+        if end < size - 1:
+            # 잘린 마지막 줄 제거
+            newline = data.rfind(b'\n')
+            data = data[:newline + 1] if newline >= 0 else b''
+        segments.append(data)
+    return segments
+
+
+def sniff_encoding(data):
+    """Guess the text encoding of a sample (BOM first, then strict decode attempts)."""
+    if data.startswith(b'\xef\xbb\xbf'):
+        return 'utf-8-sig'
+    if data.startswith(b'\xff\xfe') or data.startswith(b'\xfe\xff'):
+        return 'utf-16'
+    for encoding in CSV_FALLBACK_ENCODINGS:
+        try:
+            # 샘플 끝에서 multi-byte 문자가 잘렸을 수 있으므로 마지막 몇 byte는 제외하고 검사
+            data[:-4].decode(encoding) if len(data) > 4 else data.decode(encoding)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return 'latin-1'
+
+
+def sniff_delimiter(text):
+    import csv
+    lines = text.splitlines()[:50]
+    try:
+        return csv.Sniffer().sniff('\n'.join(lines), delimiters=CSV_DELIMITERS).delimiter
+    except csv.Error:
+        header = lines[0] if lines else ''
+        counts = {d: header.count(d) for d in CSV_DELIMITERS}
+        best = max(counts, key=counts.get)
+        return best if counts[best] > 0 else ','
+
+
+class _ColumnStats:
+    """Running type lattice for one CSV column."""
+
+    def __init__(self):
+        self.seen = 0
+        self.is_int = True
+        self.is_decimal = True
+        self.is_float = True
+        self.is_bool = True
+        self.is_date = True
+        self.is_timestamp = True
+        self.int_digits = 0
+        self.scale = 0
+        self.frac_seconds = 0
+        self.max_bytes = 0
+
+    def add(self, value):
+        value = value.strip()
+        if value == '':
+            return
+        self.seen += 1
+        self.max_bytes = max(self.max_bytes, len(value.encode('utf-8')))
+
+        if self.is_int or self.is_decimal:
+            m = _DECIMAL_RE.match(value)
+            if not m:
+                self.is_int = False
+                self.is_decimal = False
+            elif m.group(1).lstrip('-+').startswith('0') and len(m.group(1).lstrip('-+')) > 1:
+                # 앞자리 0 (우편번호, 코드값 등)은 문자열로 취급
+                self.is_int = False
+                self.is_decimal = False
+                self.is_float = False
+            else:
+                self.int_digits = max(self.int_digits, len(m.group(1).lstrip('-+')))
+                if m.group(2):
+                    self.is_int = False
+                    self.scale = max(self.scale, len(m.group(2)))
+        if self.is_float and not (self.is_int or self.is_decimal):
+            try:
+                float(value)
+            except ValueError:
+                self.is_float = False
+        if self.is_bool and value.lower() not in ('true', 'false'):
+            self.is_bool = False
+        if self.is_date and not _DATE_RE.match(value):
+            self.is_date = False
+        if self.is_timestamp:
+            m = _TIMESTAMP_RE.match(value)
+            if m:
+                self.frac_seconds = max(self.frac_seconds, len(m.group(1) or ''))
+            else:
+                self.is_timestamp = False
+
+    def source_type(self):
+        if self.seen == 0:
+            return 'VARCHAR2(255)'
+        if self.is_bool:
+            return 'BOOLEAN'
+        if self.is_int:
+            width = next((w for w in _INT_WIDTHS if self.int_digits <= w), 38)
+            return f"NUMBER({width})"
+        if self.is_decimal:
+            width = next((w for w in _INT_WIDTHS if self.int_digits <= w), 38)
+            precision = min(38, width + self.scale)
+            return f"DECIMAL({precision},{self.scale})"
+        if self.is_float:
+            return 'BINARY_DOUBLE'
+        if self.is_date:
+            return 'DATE'
+        if self.is_timestamp:
+            return f"TIMESTAMP({min(self.frac_seconds, 9)})"
+        width = next((w for w in _VARCHAR_WIDTHS if self.max_bytes <= w), None)
+        return f"VARCHAR2({width})" if width else 'CLOB'
+
+
+def infer_csv_columns_from_segments(segments, max_rows=CSV_MAX_SAMPLE_ROWS):
+    """Infer column types from sampled segments (first segment holds the header).
+
+    Returns (columns, delimiter, encoding).
+    """
+    import csv
+    encoding = sniff_encoding(segments[0])
+    if encoding == 'utf-16':
+        # UTF-16은 byte 단위 줄 경계 정렬이 맞지 않으므로 head 구간만 사용
+        segments = segments[:1]
+    texts = [seg.decode(encoding, errors='replace') for seg in segments]
+    delimiter = sniff_delimiter(texts[0])
+
+    head_rows = csv.reader(io.StringIO(texts[0]), delimiter=delimiter)
+    header = next(head_rows, [])
+    stats = [_ColumnStats() for _ in header]
+    row_iters = [head_rows] + [csv.reader(io.StringIO(t), delimiter=delimiter) for t in texts[1:]]
+
+    # 구간별로 균등하게 row 수를 배분
+    per_segment = max(1, max_rows // len(row_iters))
+    for rows in row_iters:
+        for n, row in enumerate(rows):
+            if n >= per_segment:
+                break
+            if len(row) != len(header):
+                # 헤더와 컬럼 수가 다른 행 (구간 경계의 quoted newline 등)은 건너뜀
+                continue
+            for stat, value in zip(stats, row):
+                stat.add(value)
+
+    columns = []
+    for name, stat in zip(header, stats):
+        columns.append({
+            'name': str(name).strip(),
+            'type': stat.source_type(),
+            'is_pk': False,
+            'is_nullable': True,
+            'is_partition': False,
+            'comment': '',
+        })
+    return columns, delimiter, encoding
+
+
+def infer_csv_columns(client, bucket, key, byte_budget=CSV_SAMPLE_BYTES, ranges=CSV_SAMPLE_RANGES,
+                      max_rows=CSV_MAX_SAMPLE_ROWS):
+    """Column metadata for a CSV object from a fixed-size multi-range sample."""
+    segments = sample_csv_segments(client, bucket, key, byte_budget, ranges)
+    columns, _, _ = infer_csv_columns_from_segments(segments, max_rows)
+    return columns
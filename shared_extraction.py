@@ -0,0 +1,47 @@
+import re
+from collections import OrderedDict
+
+# 문자열 literal / 주석 / 공백 단위로 SQL을 나눔
+_SQL_TOKEN_RE = re.compile(r"('(?:[^']|'')*')|(--[^\n]*)|(/\*.*?\*/)|(\s+)", re.S)
+
+
+def normalize_sql(sql):
+    """Canonical form of a source query for grouping.
+
+    Comments are dropped, whitespace collapsed, everything outside string
+    literals upper-cased and a trailing ';' removed.
+    """
+    sql = sql or ''
+    out = []
+    pos = 0
+    for m in _SQL_TOKEN_RE.finditer(sql):
+        if m.start() > pos:
+            out.append(sql[pos:m.start()].upper())
+        if m.group(1):
+            out.append(m.group(1))  # 문자열 literal은 그대로
+        elif out and not out[-1].endswith(' '):
+            out.append(' ')  # 주석/공백은 공백 하나로
+        pos = m.end()
+    out.append(sql[pos:].upper())
+    normalized = ''.join(out).strip()
+    return normalized.rstrip(';').strip()
+
+
+def extraction_key(m_data):
+    return (m_data['source_conn_id'], normalize_sql(m_data['source_sql']))
+
+
+def group_by_extraction(mappings_data):
+    """Group mapping dicts by (source connection, normalized source SQL), keeping input order."""
+    groups = OrderedDict()
+    for m_data in mappings_data:
+        groups.setdefault(extraction_key(m_data), []).append(m_data)
+    return list(groups.values())
+
+
+def targets_of(members):
+    return [{
+        'mapping_id': m['id'],
+        'target_table': m['target_table'],
+        'target_conn': m['target_conn_name'],
+    } for m in members]
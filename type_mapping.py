@@ -0,0 +1,150 @@
+import re
+from functools import lru_cache
+
+# s3 소스는 s3_schema에서 Oracle 스타일 타입으로 추론되므로 Oracle 규칙을 그대로 사용
+SOURCE_ALIASES = {'s3': 'oracle'}
+
+TYPE_CACHE_SIZE = 4096
+
+
+def _size(t, default):
+    m = re.search(r'\((\d+)', t)
+    return m.group(1) if m else default
+
+
+def _args(t):
+    """Text inside the first (...) or None, e.g. 'NUMBER(10,2)' -> '10,2'."""
+    m = re.search(r'\((.+?)\)', t)
+    return m.group(1) if m else None
+
+
+def _wrap(name, t, default=None):
+    args = _args(t)
+    if args:
+        return f"{name}({args})"
+    return default or name
+
+
+# (source, target) -> [(pattern, result)]
+# pattern은 대문자/공백 정리된 타입 문자열에 match(접두) 또는 search('~'로 시작)로 적용
+# result는 고정 문자열 또는 callable(t, original)
+TYPE_RULES = {
+    ('oracle', 'postgres'): [
+        ('~NVARCHAR', lambda t, o: f"VARCHAR({_size(t, '255')})"),
+        ('~VARCHAR', lambda t, o: t.replace('VARCHAR2', 'VARCHAR')),
+        ('NCHAR', lambda t, o: t.replace('NCHAR', 'CHAR')),
+        ('CHAR', lambda t, o: t),
+        ('NUMBER', lambda t, o: _wrap('NUMERIC', t)),
+        ('INTEGER$', 'INTEGER'),
+        ('DECIMAL', lambda t, o: t.replace('DECIMAL', 'NUMERIC')),
+        ('(FLOAT|BINARY_FLOAT)$', 'REAL'),
+        ('BINARY_DOUBLE$', 'DOUBLE PRECISION'),
+        ('DATE$', 'TIMESTAMP'),
+        ('TIMESTAMP', 'TIMESTAMP'),
+        ('(CLOB|NCLOB|LONG|TEXT)$', 'TEXT'),
+        ('(BLOB|LONG RAW|RAW)', 'BYTEA'),
+        ('SYSTEM$', 'TIMESTAMP'),  # ETL_CRY_DTM 등 시스템 생성 컬럼
+    ],
+    ('oracle', 'oracle'): [
+        ('NCHAR', lambda t, o: o.replace('NCHAR', 'CHAR')),
+    ],
+    ('oracle', 'mysql'): [
+        ('~N?VARCHAR', lambda t, o: f"VARCHAR({_size(t, '255')})"),
+        ('N?CHAR', lambda t, o: f"CHAR({_size(t, '1')})"),
+        ('NUMBER', lambda t, o: _wrap('DECIMAL', t, 'DECIMAL(38,10)')),
+        ('INTEGER$', 'BIGINT'),
+        ('DECIMAL', lambda t, o: t),
+        ('(FLOAT|BINARY_FLOAT)$', 'FLOAT'),
+        ('BINARY_DOUBLE$', 'DOUBLE'),
+        ('DATE$', 'DATETIME'),
+        ('TIMESTAMP', 'DATETIME(6)'),
+        ('(CLOB|NCLOB|LONG|TEXT)$', 'LONGTEXT'),
+        ('(BLOB|LONG RAW)$', 'LONGBLOB'),
+        ('RAW', lambda t, o: f"VARBINARY({_size(t, '2000')})"),
+        ('SYSTEM$', 'DATETIME'),
+    ],
+    ('mysql', 'postgres'): [
+        ('(TINYINT\\(1\\)|BOOL|BOOLEAN|BIT\\(1\\))$', 'BOOLEAN'),
+        ('BIGINT.*UNSIGNED', 'NUMERIC(20)'),
+        ('(TINYINT|SMALLINT)', 'SMALLINT'),
+        ('(MEDIUMINT|INTEGER|INT)\\b(?!.*UNSIGNED)', 'INTEGER'),
+        ('(MEDIUMINT|INTEGER|INT)\\b', 'BIGINT'),
+        ('BIGINT', 'BIGINT'),
+        ('(DECIMAL|NUMERIC)', lambda t, o: _wrap('NUMERIC', t)),
+        ('FLOAT', 'REAL'),
+        ('(DOUBLE|REAL)', 'DOUBLE PRECISION'),
+        ('(DATETIME|TIMESTAMP)', 'TIMESTAMP'),
+        ('(TINY|MEDIUM|LONG)?TEXT$', 'TEXT'),
+        ('(ENUM|SET)\\(', 'TEXT'),
+        ('((TINY|MEDIUM|LONG)?BLOB|VARBINARY|BINARY)', 'BYTEA'),
+        ('JSON$', 'JSONB'),
+        ('YEAR', 'SMALLINT'),
+    ],
+    ('postgres', 'oracle'): [
+        ('(CHARACTER VARYING|VARCHAR)', lambda t, o: f"VARCHAR2({_size(t, '4000')})"),
+        ('(CHARACTER|CHAR|BPCHAR)\\b', lambda t, o: f"CHAR({_size(t, '1')})"),
+        ('TEXT$', 'CLOB'),
+        ('(NUMERIC|DECIMAL)', lambda t, o: _wrap('NUMBER', t)),
+        ('SMALLINT$', 'NUMBER(5)'),
+        ('(INTEGER|INT|INT4)$', 'NUMBER(10)'),
+        ('(BIGINT|INT8)$', 'NUMBER(19)'),
+        ('(REAL|FLOAT4)$', 'BINARY_FLOAT'),
+        ('(DOUBLE PRECISION|FLOAT8)$', 'BINARY_DOUBLE'),
+        ('BOOL(EAN)?$', 'NUMBER(1)'),
+        ('TIMESTAMP', 'TIMESTAMP'),
+        ('DATE$', 'DATE'),
+        ('BYTEA$', 'BLOB'),
+        ('JSONB?$', 'CLOB'),
+    ],
+}
+
+
+def _compile(rules):
+    compiled = []
+    for pattern, result in rules:
+        if pattern.startswith('~'):
+            compiled.append((re.compile(pattern[1:]).search, result))
+        else:
+            compiled.append((re.compile(pattern).match, result))
+    return compiled
+
+
+# 정규식은 import 시점에 한 번만 컴파일
+_COMPILED_RULES = {pair: _compile(rules) for pair, rules in TYPE_RULES.items()}
+
+
+def normalize_db_type(db_type, default='oracle'):
+    db_type = (db_type or default).lower()
+    return SOURCE_ALIASES.get(db_type, db_type)
+
+
+@lru_cache(maxsize=TYPE_CACHE_SIZE)
+def _convert(type_str, source, target):
+    t = type_str.upper().strip()
+    for matcher, result in _COMPILED_RULES.get((source, target), ()):
+        if matcher(t):
+            return result(t, type_str) if callable(result) else result
+    # 규칙이 없으면 원래 타입 유지 (같은 DB끼리, 미지원 조합 포함)
+    return type_str
+
+
+def convert_type(type_str, source='oracle', target='postgres'):
+    """Convert one column type from the source DB dialect to the target dialect.
+
+    Results are memoized per distinct (type, source, target).
+    """
+    if not type_str:
+        return type_str
+    return _convert(type_str, normalize_db_type(source), normalize_db_type(target, 'postgres'))
+
+
+def convert_types(type_strs, source='oracle', target='postgres'):
+    """Batch version of convert_type; each distinct type string is converted once."""
+    source = normalize_db_type(source)
+    target = normalize_db_type(target, 'postgres')
+    converted = {t: _convert(t, source, target) for t in set(type_strs) if t}
+    return [converted.get(t, t) for t in type_strs]
+
+
+def cache_info():
+    return _convert.cache_info()
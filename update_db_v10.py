@@ -0,0 +1,90 @@
+import re
+import sqlite3
+import os
+
+# (table, FK column, referenced table, ON DELETE action)
+FOREIGN_KEYS = [
+    ('mapping_column', 'mapping_id', 'mapping', 'CASCADE'),
+    ('generated_dag', 'mapping_id', 'mapping', 'SET NULL'),
+    ('generated_dag', 'template_id', 'template', 'SET NULL'),
+]
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_mapping_column_mapping_id ON mapping_column (mapping_id)",
+    "CREATE INDEX IF NOT EXISTS ix_generated_dag_mapping_id ON generated_dag (mapping_id)",
+]
+
+
+def rebuild_table(cursor, table, foreign_keys):
+    """SQLite는 FK 변경이 안 되므로 새 테이블로 복사 후 교체"""
+    cursor.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (table,))
+    create_sql = cursor.fetchone()[0]
+    new_sql = create_sql
+    for column, ref_table, action in foreign_keys:
+        pattern = re.compile(rf"(FOREIGN KEY\s*\(\s*{column}\s*\)\s*REFERENCES\s+\"?{ref_table}\"?\s*\(\s*id\s*\))(\s+ON DELETE\s+\w+(\s+NULL)?)?", re.I)
+        new_sql = pattern.sub(rf"\1 ON DELETE {action}", new_sql)
+    if new_sql == create_sql:
+        return False
+
+    cursor.execute("SELECT sql FROM sqlite_master WHERE type='index' AND tbl_name=? AND sql IS NOT NULL", (table,))
+    index_sqls = [row[0] for row in cursor.fetchall()]
+    cursor.execute("PRAGMA table_info(%s)" % table)
+    columns = ', '.join(col[1] for col in cursor.fetchall())
+
+    cursor.execute(new_sql.replace(f'CREATE TABLE {table}', f'CREATE TABLE {table}__new', 1).replace(f'CREATE TABLE "{table}"', f'CREATE TABLE {table}__new', 1))
+    cursor.execute(f"INSERT INTO {table}__new ({columns}) SELECT {columns} FROM {table}")
+    cursor.execute(f"DROP TABLE {table}")
+    cursor.execute(f"ALTER TABLE {table}__new RENAME TO {table}")
+    for index_sql in index_sqls:
+        cursor.execute(index_sql)
+    return True
+
+
+def update_db():
+    db_path = os.path.join(os.path.dirname(__file__), 'instance', 'toy_airflow.db')
+
+    if not os.path.exists(db_path):
+        print(f"Database file not found at {db_path}")
+        return
+
+    print(f"Connecting to database at {db_path}")
+    conn = sqlite3.connect(db_path)
+    conn.isolation_level = None  # PRAGMA foreign_keys는 transaction 밖에서만 바뀜
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("PRAGMA foreign_keys=OFF")
+        cursor.execute("BEGIN")
+
+        # 이미 삭제된 mapping을 가리키는 행 정리 (FK 검사를 켜면 위반이 되므로)
+        cursor.execute("DELETE FROM mapping_column WHERE mapping_id NOT IN (SELECT id FROM mapping)")
+        print(f"Removed {cursor.rowcount} orphaned mapping_column rows.")
+        cursor.execute("UPDATE generated_dag SET mapping_id = NULL WHERE mapping_id IS NOT NULL AND mapping_id NOT IN (SELECT id FROM mapping)")
+        cursor.execute("UPDATE generated_dag SET template_id = NULL WHERE template_id IS NOT NULL AND template_id NOT IN (SELECT id FROM template)")
+
+        for table in dict.fromkeys(fk[0] for fk in FOREIGN_KEYS):
+            fks = [fk[1:] for fk in FOREIGN_KEYS if fk[0] == table]
+            if rebuild_table(cursor, table, fks):
+                print(f"Rebuilt {table} with ON DELETE rules.")
+            else:
+                print(f"{table} already has ON DELETE rules. No update needed.")
+        for index_sql in INDEXES:
+            cursor.execute(index_sql)
+
+        cursor.execute("PRAGMA foreign_key_check")
+        violations = cursor.fetchall()
+        if violations:
+            raise RuntimeError(f"Foreign key violations after rebuild: {violations[:5]}")
+
+        cursor.execute("COMMIT")
+        print("Successfully updated database schema.")
+
+    except Exception as e:
+        print(f"Error updating database: {e}")
+        cursor.execute("ROLLBACK")
+    finally:
+        cursor.execute("PRAGMA foreign_keys=ON")
+        conn.close()
+
+if __name__ == "__main__":
+    update_db()
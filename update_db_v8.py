@@ -0,0 +1,44 @@
+import sqlite3
+import os
+
+def update_db():
+    db_path = os.path.join(os.path.dirname(__file__), 'instance', 'toy_airflow.db')
+    
+    if not os.path.exists(db_path):
+        print(f"Database file not found at {db_path}")
+        return
+
+    print(f"Connecting to database at {db_path}")
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        # Check if source_sql already exists
+        cursor.execute("PRAGMA table_info(mapping)")
+        columns = [col[1] for col in cursor.fetchall()]
+        
+        added = False
+        if 'source_sql' not in columns:
+            print("Adding source_sql column to mapping table...")
+            cursor.execute("ALTER TABLE mapping ADD COLUMN source_sql TEXT")
+            added = True
+            
+        if 'source_sql_version' not in columns:
+            print("Adding source_sql_version column to mapping table...")
+            cursor.execute("ALTER TABLE mapping ADD COLUMN source_sql_version INTEGER DEFAULT 0")
+            added = True
+
+        if added:
+            conn.commit()
+            print("Successfully updated database schema.")
+        else:
+            print("Columns already exist. No update needed.")
+
+    except Exception as e:
+        print(f"Error updating database: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    update_db()
@@ -0,0 +1,36 @@
+import sqlite3
+import os
+
+def update_db():
+    db_path = os.path.join(os.path.dirname(__file__), 'instance', 'toy_airflow.db')
+    
+    if not os.path.exists(db_path):
+        print(f"Database file not found at {db_path}")
+        return
+
+    print(f"Connecting to database at {db_path}")
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        # Check if content_hash already exists
+        cursor.execute("PRAGMA table_info(generated_dag)")
+        columns = [col[1] for col in cursor.fetchall()]
+        
+        if 'content_hash' not in columns:
+            print("Adding content_hash column to generated_dag table...")
+            cursor.execute("ALTER TABLE generated_dag ADD COLUMN content_hash VARCHAR(64)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS ix_generated_dag_content_hash ON generated_dag (content_hash)")
+            conn.commit()
+            print("Successfully updated database schema.")
+        else:
+            print("Column already exists. No update needed.")
+
+    except Exception as e:
+        print(f"Error updating database: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    update_db()
@@ -1,6 +1,7 @@
 
 # verify_replacement.py
 from datetime import datetime
+from dag_renderer import render_template_code
 
 def verify_dag_generation():
     # Mock data similar to what's in app.py
@@ -29,33 +30,25 @@ def verify_dag_generation():
         ("Template 5: {{ TABLE_NAME }}", "Template 5: employees_target"),
         ("Template 6: {{Dag_Name}}", f"Template 6: {dag_name}"),
         ("Template 7: {{DAG_NAME}}", f"Template 7: {dag_name}"),
-        ("Mixed: {{DAG_NAME}} -> {{TABLE_NAME}}", f"Mixed: {dag_name} -> employees_target")
+        ("Mixed: {{DAG_NAME}} -> {{TABLE_NAME}}", f"Mixed: {dag_name} -> employees_target"),
+        ("Template 8: {{source_table}} / {{  Target_Table}}", "Template 8: HR.EMPLOYEES / employees_target"),
+        ("Airflow macro: {{ ds }} {{ DAG_NAME }}", f"Airflow macro: {{{{ ds }}}} {dag_name}")
     ]
 
-    # Replacement logic from app.py
-    replacements = {
-        '{{ source_sql }}': m_data['source_sql'],
-        '{{ Source_SQL }}': m_data['source_sql'],
-        '{{Source_SQL}}': m_data['source_sql'],
-        '{{ SOURCE_SQL }}': m_data['source_sql'],
-        '{{SOURCE_SQL}}': m_data['source_sql'],
-        '{{ source_table }}': m_data['source_table'],
-        '{{ target_table }}': m_data['target_table'],
-        '{{ TABLE_NAME }}': m_data['target_table'],
-        '{{TABLE_NAME}}': m_data['target_table'],
-        '{{ source_conn }}': m_data['source_conn_name'],
-        '{{ target_conn }}': m_data['target_conn_name'],
-        '{{ Dag_Name }}': dag_name,
-        '{{Dag_Name}}': dag_name,
-        '{{DAG_NAME}}': dag_name
+    # Rendering values as passed by app.py (placeholder 이름은 대소문자/공백 무관)
+    values = {
+        'source_sql': m_data['source_sql'],
+        'source_table': m_data['source_table'],
+        'target_table': m_data['target_table'],
+        'source_conn': m_data['source_conn_name'],
+        'target_conn': m_data['target_conn_name'],
+        'dag_name': dag_name,
     }
 
     print("Starting Verification...")
     all_passed = True
     for tmpl_str, expected in templates:
-        dag_code = tmpl_str
-        for key, value in replacements.items():
-            dag_code = dag_code.replace(key, value)
+        dag_code = render_template_code(tmpl_str, values)
         
         if dag_code == expected:
             print(f"[PASS] Template: '{tmpl_str}' -> '{dag_code}'")
@@ -0,0 +1,83 @@
+import os
+import stat
+import zipfile
+
+ZIP_CHUNK_SIZE = 64 * 1024
+
+
+class _ZipSink:
+    """Write-only file object that hands compressed bytes to the generator.
+
+    It has no tell()/seek(), so zipfile writes data descriptors after each
+    entry instead of seeking back into the archive.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        chunks, self._chunks = self._chunks, []
+        return b''.join(chunks)
+
+
+def _unique_arcname(arcname, used):
+    if arcname not in used:
+        return arcname
+    base, ext = os.path.splitext(arcname)
+    n = 2
+    while f"{base}_{n}{ext}" in used:
+        n += 1
+    return f"{base}_{n}{ext}"
+
+
+def iter_zip(entries, on_entry=None, chunk_size=ZIP_CHUNK_SIZE):
+    """Yield a ZIP archive of (arcname, filepath) entries piece by piece.
+
+    Files are read and compressed chunk_size bytes at a time, so memory stays
+    constant whatever the archive size. Missing files are skipped, a file
+    listed more than once (fan-out DAGs share one file) is added once, and
+    clashing arcnames get a _2, _3, ... suffix. on_entry(count) is called
+    after every entry, including skipped ones.
+    """
+    sink = _ZipSink()
+    seen_paths = set()
+    used_names = set()
+    count = 0
+    with zipfile.ZipFile(sink, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for arcname, filepath in entries:
+            count += 1
+            try:
+                # 게시된 DAG 파일은 blob을 가리키는 link이므로 realpath가 아닌 경로 자체로 중복 판단
+                abs_path = os.path.abspath(filepath) if filepath else None
+                if abs_path and abs_path not in seen_paths and os.path.isfile(abs_path):
+                    seen_paths.add(abs_path)
+                    zinfo = zipfile.ZipInfo.from_file(abs_path, _unique_arcname(arcname or os.path.basename(abs_path), used_names))
+                    zinfo.compress_type = zipfile.ZIP_DEFLATED
+                    zinfo.external_attr = (stat.S_IFREG | 0o644) << 16  # 읽기 전용 blob 권한 대신 일반 파일 권한
+                    used_names.add(zinfo.filename)
+                    with open(abs_path, 'rb') as src, zf.open(zinfo, 'w') as dst:
+                        while True:
+                            block = src.read(chunk_size)
+                            if not block:
+                                break
+                            dst.write(block)
+                            data = sink.drain()
+                            if data:
+                                yield data
+            except OSError as e:
+                print(f"Error zipping {filepath}: {str(e)}")
+            data = sink.drain()
+            if data:
+                yield data
+            if on_entry:
+                on_entry(count)
+    data = sink.drain()
+    if data:
+        yield data